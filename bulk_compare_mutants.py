@@ -1,12 +1,92 @@
 import argparse
 import logging
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, Set
 
 import pandas as pd
-from compare_mutants import main
-
+from compare_mutants import compare_reports, get_mutants, parse_report
+
+from src.incidence import get_incidence_paths, write_incidence
+from src.model import Mutant, MutantsComparerSets, Report
+from src.summary import (
+    ConsolidatedSummarySink,
+    CountsSummarySink,
+    DirectorySummarySink,
+    NullSummarySink,
+    SummarySink,
+)
 from src.utility import subjects, tools
 
+# how the comparisons' summaries are written; 'none' by default
+SUMMARY_CHOICES = ("none", "counts", "consolidated", "directory")
+
+# full writes the mutants in every cell, compact writes an incidence table
+OUTPUT_FORMAT_CHOICES = ("full", "compact")
+
+MODULE = pathlib.Path(__file__).stem
+
+# the base report (and its mutants set) shared by
+# the comparisons of this process, set by init_comparisons
+base_report: Optional[Report] = None
+base_set: Optional[Set[Mutant]] = None
+
+
+class ComparisonsFilter(logging.Filter):
+    """Filter out the records of the comparisons below WARNING,
+    to exclude printing them except for severe problems"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or record.module == MODULE
+
+
+def init_comparisons(report: Report, mutants_set: Set[Mutant]):
+    global base_report, base_set
+    base_report = report
+    base_set = mutants_set
+
+
+def compare_directory(
+    directory: pathlib.Path,
+    root: pathlib.Path,
+    subject: str,
+    tool: str,
+    data_type: str,
+    index: bool,
+    sink: SummarySink,
+) -> pd.Series:
+    """Parse the report of a directory and compare it with the base one;
+    it's a module function so that it can be executed in a worker process"""
+    logging.info(f"Comparison with {directory}")
+
+    files2 = list(directory.iterdir())
+    report = parse_report(root, subject, tool, files2, args_absolute_path=True)
+    comparer = compare_reports(
+        base_report,
+        report,
+        subject,
+        tool,
+        dirname=f"{subject} {tool} {directory.name}",
+        first_set=base_set,
+        sink=sink,
+    )
+
+    return comparer.get_series(
+        name=directory.name, data_type=data_type, index=index, kind="second"
+    )
+
+
+def get_summary_sink(summary: str, root: pathlib.Path, name: str) -> SummarySink:
+    if summary == "counts":
+        return CountsSummarySink(root / f"{name}_summary.csv")
+    elif summary == "consolidated":
+        return ConsolidatedSummarySink(root / f"{name}_summary.txt.gz")
+    elif summary == "directory":
+        return DirectorySummarySink()
+    else:
+        return NullSummarySink()
+
 
 def set_logging(name: str = None):
     # FORMAT = "%(levelname)s :: %(asctime)s :: %(module)s, line %(lineno)d :: %(message)s"
@@ -23,6 +103,7 @@ def set_logging(name: str = None):
     _logger = logging.getLogger(name)
     _logger.addHandler(file_handler)
     _logger.addHandler(stream_handler)
+    _logger.addFilter(ComparisonsFilter())
     _logger.setLevel(logging.DEBUG)
 
     return _logger
@@ -42,6 +123,17 @@ if __name__ == "__main__":
     # set root for files
     parser.add_argument("--root")
 
+    # set the number of worker processes comparing directories
+    parser.add_argument("-j", "--jobs", type=int, default=1)
+
+    # set how to write the comparisons' summaries
+    parser.add_argument("--summary", choices=SUMMARY_CHOICES, default="none")
+
+    # set the output format: mutants' table, or incidence table and mutants
+    parser.add_argument(
+        "--output-format", choices=OUTPUT_FORMAT_CHOICES, default="full"
+    )
+
     args = parser.parse_args()
 
     root = args.root
@@ -49,7 +141,8 @@ if __name__ == "__main__":
         root = f"data_cmp/{args.subject}/{args.tool}"
     root = pathlib.Path(root)
 
-    directories = [dir_ for dir_ in root.iterdir() if dir_.is_dir()]
+    # sorted, so that columns are in a deterministic order
+    directories = sorted(dir_ for dir_ in root.iterdir() if dir_.is_dir())
     basename = "_single_dev"
     base = [dir_ for dir_ in directories if dir_.name == basename]
     assert len(base) > 0, f"No {basename} found inside {root}"
@@ -60,54 +153,70 @@ if __name__ == "__main__":
     files1 = list(base.iterdir())
     series = []
 
-    # set level to WARNING to exclude printing to stdout
-    # except for severe problems
     logger.info(f"Base directory found: {base}")
 
     data_type = "original"
     index = True
 
-    # compare to itself to gen first column - that is, single_dev live mutants
+    # the base report and its mutants set are made once,
+    # and shared by every comparison
     logger.info("Getting dev mutants")
 
-    logger.setLevel(logging.WARNING)
-    comparer = main(
-        root, args.subject, args.tool, files1, files1, args_absolute_path=True
+    _base_report = parse_report(
+        root, args.subject, args.tool, files1, args_absolute_path=True
+    )
+    base_mutants = get_mutants(_base_report)
+    _base_set = MutantsComparerSets.get_checked_set(base_mutants)
+
+    # first column - that is, single_dev live mutants
+    comparer = MutantsComparerSets(
+        base_mutants, base_mutants, first_set=_base_set, second_set=_base_set
     )
     series.append(
         comparer.get_series(
             name="single_dev", kind="first", data_type=data_type, index=index
         )
     )
-    # restore level
-    logger.setLevel(logging.INFO)
-
-    for i, directory in enumerate(directories):
-        if i > 0:
-            logger.info("-" * 50)
 
+    for directory in directories:
         if basename not in directory.name:
             logger.info(f"Skipping {directory}")
-            continue
-
-        files2 = list(directory.iterdir())
-        logger.info(f"Comparison with {directory}")
-
-        logger.setLevel(logging.WARNING)
-        comparer = main(
-            root, args.subject, args.tool, files1, files2, args_absolute_path=True
-        )
-        logger.setLevel(logging.INFO)
-
-        series.append(
-            comparer.get_series(
-                name=directory.name, data_type=data_type, index=index, kind="second"
-            )
-        )
+    directories = [dir_ for dir_ in directories if basename in dir_.name]
+
+    compare = partial(
+        compare_directory,
+        root=root,
+        subject=args.subject,
+        tool=args.tool,
+        data_type=data_type,
+        index=index,
+        sink=get_summary_sink(args.summary, root, f"{args.subject}_{args.tool}"),
+    )
 
-    df = pd.DataFrame(series)
-    path = f"{root}/{args.subject}_{args.tool}.csv"
-    path = pathlib.Path(path)
-    df.to_csv(path)
-    logger.info(f"Dataframe saved as csv in {path}")
-    logger.info(f"Live Mutants count = {df.count(1)}")
+    # directories are independent, so they can be compared in parallel;
+    # map returns their columns in the same (sorted) order
+    if args.jobs > 1 and len(directories) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(args.jobs, len(directories)),
+            initializer=init_comparisons,
+            initargs=(_base_report, _base_set),
+        ) as executor:
+            series += executor.map(compare, directories)
+    else:
+        init_comparisons(_base_report, _base_set)
+        series += map(compare, directories)
+
+    if args.output_format == "compact":
+        prefix = root / f"{args.subject}_{args.tool}"
+        write_incidence(series, prefix)
+        paths = get_incidence_paths(prefix)
+        logger.info(f"Incidence table and mutants saved as csv in {paths}")
+        counts = pd.Series([len(s) for s in series], index=[s.name for s in series])
+        logger.info(f"Live Mutants count = {counts}")
+    else:
+        df = pd.DataFrame(series)
+        path = f"{root}/{args.subject}_{args.tool}.csv"
+        path = pathlib.Path(path)
+        df.to_csv(path)
+        logger.info(f"Dataframe saved as csv in {path}")
+        logger.info(f"Live Mutants count = {df.count(1)}")
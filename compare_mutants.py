@@ -1,11 +1,15 @@
 import argparse
 import logging
 from os import PathLike
-from typing import Union
+from typing import Optional, Set, Union
 
-from src.model import MutantsComparerSets
+from src.model import Mutant, MutantsComparerSets, Report
+from src.summary import SummarySink
 from src.utility import get_report, subjects, tools
 
+VALID_COMPARE_VALUES = "live", "killed", "all"
+MAX_FILES_LENGTH = 2
+
 
 def set_logging():
     # FORMAT = "%(levelname)s :: %(asctime)s :: %(module)s, line %(lineno)d :: %(message)s"
@@ -26,57 +30,95 @@ def set_logging():
     return logger
 
 
-def main(
-    root: Union[str, PathLike],
-    subject: str,
-    tool: str,
-    files1: [str],
-    files2: [str],
-    compare: str = "live",
-    dirname: str = None,
-    args_absolute_path: bool = False,
-) -> MutantsComparerSets:
-    valid_compare_values = "live", "killed", "all"
-    if compare not in valid_compare_values:
+def check_compare(compare: str):
+    if compare not in VALID_COMPARE_VALUES:
         raise ValueError(
             f"Invalid compare value provided ({compare})"
-            f"\nValid compare values are {valid_compare_values}"
+            f"\nValid compare values are {VALID_COMPARE_VALUES}"
         )
 
-    max_files_length = 2
 
-    if len(files1) > max_files_length:
-        raise ValueError(f"files1 can hold up to {max_files_length} arguments")
-
-    if len(files2) > max_files_length:
-        raise ValueError(f"files2 can hold up to {max_files_length} arguments")
+def parse_report(
+    root: Union[str, PathLike],
+    subject: str,
+    tool: str,
+    files: [str],
+    args_absolute_path: bool = False,
+) -> Report:
+    """Get the report of files, already parsed"""
+    if len(files) > MAX_FILES_LENGTH:
+        raise ValueError(f"files can hold up to {MAX_FILES_LENGTH} arguments")
 
-    report1 = get_report(
-        subject, tool, *files1, root=root, args_absolute_path=args_absolute_path
+    report = get_report(
+        subject, tool, *files, root=root, args_absolute_path=args_absolute_path
     )
-    report1.makeit()
+    report.makeit()
+    return report
 
-    report2 = get_report(
-        subject, tool, *files2, root=root, args_absolute_path=args_absolute_path
-    )
-    report2.makeit()
 
-    mutants = list()
+def get_mutants(report: Report, compare: str = "live") -> [Mutant]:
+    check_compare(compare)
+
     if compare == "live":
-        mutants = report1.get_live_mutants(), report2.get_live_mutants()
+        return report.get_live_mutants()
     elif compare == "killed":
-        mutants = report1.get_killed_mutants(), report2.get_killed_mutants()
-    elif compare == "all":
-        mutants = report1.get_mutants(), report2.get_mutants()
+        return report.get_killed_mutants()
+    else:
+        return report.get_mutants()
+
 
-    comparer = MutantsComparerSets(*mutants)
+def compare_reports(
+    report1: Report,
+    report2: Report,
+    subject: str,
+    tool: str,
+    compare: str = "live",
+    dirname: str = None,
+    first_set: Optional[Set[Mutant]] = None,
+    sink: Optional[SummarySink] = None,
+) -> MutantsComparerSets:
+    """Compare two parsed reports; first_set is the (already checked)
+    set of the first report mutants, if it's shared by many comparisons,
+    while sink is where the summary is written (see MutantsComparerSets.summary)"""
+    comparer = MutantsComparerSets(
+        get_mutants(report1, compare),
+        get_mutants(report2, compare),
+        first_set=first_set,
+    )
 
     dirname = dirname or f"{subject} {tool}"
-    comparer.summary(dirname=dirname)
+    comparer.summary(dirname=dirname, sink=sink)
 
     return comparer
 
 
+def main(
+    root: Union[str, PathLike],
+    subject: str,
+    tool: str,
+    files1: [str],
+    files2: [str],
+    compare: str = "live",
+    dirname: str = None,
+    args_absolute_path: bool = False,
+    sink: Optional[SummarySink] = None,
+) -> MutantsComparerSets:
+    check_compare(compare)
+
+    if len(files1) > MAX_FILES_LENGTH:
+        raise ValueError(f"files1 can hold up to {MAX_FILES_LENGTH} arguments")
+
+    if len(files2) > MAX_FILES_LENGTH:
+        raise ValueError(f"files2 can hold up to {MAX_FILES_LENGTH} arguments")
+
+    report1 = parse_report(root, subject, tool, files1, args_absolute_path)
+    report2 = parse_report(root, subject, tool, files2, args_absolute_path)
+
+    return compare_reports(
+        report1, report2, subject, tool, compare=compare, dirname=dirname, sink=sink
+    )
+
+
 if __name__ == "__main__":
     logger = set_logging()
 
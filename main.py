@@ -1,6 +1,10 @@
+import argparse
 import logging
 
+from reports.cache import ReportCache
+
 from src import MutantError, ReportFactory, subjects, tools
+from src.diff import ALGORITHMS, DEFAULT_ALGORITHM
 
 # FORMAT = "%(levelname)s :: %(asctime)s :: %(module)s, line %(lineno)d :: %(message)s"
 FORMAT = "%(levelname)s :: [%(module)s.%(funcName)s.%(lineno)d] :: %(message)s"
@@ -24,12 +28,21 @@ logger.addHandler(file_debug_handler)
 logger.setLevel(logging.DEBUG)
 
 
-def main(base_dir="data"):
+def main(base_dir="data", algorithm=DEFAULT_ALGORITHM):
+    # every tool of a subject shares the same line offset map
+    cache = ReportCache()
+
     for subject in subjects:
         for tool in tools:
             logging.warning(f"Working on subject {subject} and tool {tool}")
             try:
-                factory = ReportFactory(tool=tool, subject=subject, base_dir=base_dir)
+                factory = ReportFactory(
+                    tool=tool,
+                    subject=subject,
+                    base_dir=base_dir,
+                    cache=cache,
+                    algorithm=algorithm,
+                )
                 factory.write_all_mutants()
             except MutantError as e:
                 logging.error(f"Mutant error caught: {e}")
@@ -38,4 +51,12 @@ def main(base_dir="data"):
 
 
 if __name__ == "__main__":
-    main(base_dir="data_dummy")
+    parser = argparse.ArgumentParser()
+
+    # set the diff algorithm of buggy and fixed source files
+    parser.add_argument(
+        "--diff-algorithm", choices=ALGORITHMS, default=DEFAULT_ALGORITHM
+    )
+
+    args = parser.parse_args()
+    main(base_dir="data_dummy", algorithm=args.diff_algorithm)
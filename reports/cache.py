@@ -0,0 +1,118 @@
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+from typing import Optional, Union
+
+logger = logging.getLogger(__file__)
+
+# bump it when the parsed state of reports changes
+CACHE_VERSION = 2
+
+DEFAULT_CACHE_DIR = ".reports_cache"
+DEFAULT_CACHE_MAX_SIZE = 512 * 1024 * 1024  # bytes
+
+
+class ReportCache:
+    """Local cache of parsed reports.
+
+    Every entry is the pickled state of a report (see Report.dump_state),
+    keyed by the report tool, the hash of its content and its class under
+    mutation (if known before parsing, as with Judy); other parsed
+    artifacts, as the line offset maps of source files, are keyed alike.
+    Entries are evicted in least recently used order when the cache
+    exceeds its maximum size, in bytes"""
+
+    suffix = ".pickle"
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike] = DEFAULT_CACHE_DIR,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    ):
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"ReportCache(directory={self.directory}, max_size={self.max_size})"
+
+    def get_path(
+        self, tool: str, content_hash: str, class_under_mutation: Optional[str]
+    ) -> pathlib.Path:
+        key = f"{CACHE_VERSION}_{tool}_{content_hash}_{class_under_mutation or ''}"
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{name}{self.suffix}"
+
+    def load(
+        self, tool: str, content_hash: str, class_under_mutation: Optional[str]
+    ) -> Optional[dict]:
+        """Get the cached state, or None if missing"""
+        path = self.get_path(tool, content_hash, class_under_mutation)
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Removing broken cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # mark the entry as recently used; another process may have
+        # evicted it meanwhile, but the state is already loaded
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        logger.debug(f"Cache hit: {path}")
+        return state
+
+    def store(
+        self,
+        tool: str,
+        content_hash: str,
+        class_under_mutation: Optional[str],
+        state: dict,
+    ):
+        """Write the state in cache, then evict entries if needed"""
+        path = self.get_path(tool, content_hash, class_under_mutation)
+
+        # write on a temporary file and then replace, so that readers
+        # (even in other processes) never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        logger.debug(f"Cache store: {path}")
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries
+        until the cache fits its maximum size"""
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+            logger.debug(f"Cache evict: {path}")
+
+    def clear(self):
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
@@ -1,8 +1,18 @@
 from abc import ABC
 from typing import Any, List, Optional
 
+import numpy as np
 import pandas as pd
+from reports.incidence import MutantsIncidence, get_minimal_rows, popcount
 from reports.reports import Report
+from reports.similarity import (
+    MINHASH_PERMUTATIONS,
+    estimate_jaccard,
+    get_candidate_pairs,
+    get_clusters,
+    get_lsh_bands,
+    get_minhash_signatures,
+)
 from reports.utility import get_unique_substrings
 
 
@@ -35,6 +45,8 @@ ERR_NULL_LIST = (
     "Maybe this report doesn't allow the extraction of this kind of mutants?"
 )
 
+UNION_BASE_NAME = "union({indices})"
+
 ERR_NULL_BASE_ROW = (
     "Found one or more null mutants in base row!"
     "Other reports should be made with the base testsuite and one or more test"
@@ -70,6 +82,10 @@ class Command(ABC):
     also for generating automatically the subparsers
     and their arguments."""
 
+    # if True, the command needs only the reports' counts,
+    # so reports can be lazy (see Report.lazy)
+    counts_only: bool = False
+
     def __init__(self, reports: List[Report]):
         self.reports = reports
 
@@ -104,7 +120,49 @@ class Command(ABC):
         return f"Command(reports={self.reports}"
 
 
+def get_reports_names(reports: List[Report]) -> List[str]:
+    """Short names of the reports, from their hash strings"""
+    return get_unique_substrings(
+        [report.hash_string() for report in reports], min_length=8, max_length=16
+    )
+
+
+def clip_index(index: int, n: int) -> int:
+    """Clip the index of a report: negative values
+    to the first one, too big values to the last one"""
+    return min(max(index, 0), n - 1)
+
+
+def get_incidence(
+    reports: List[Report], use_killed_mutants: bool, by_identity: bool = False
+) -> MutantsIncidence:
+    """Incidence matrix of the live (or killed) mutants of the reports;
+    if by_identity is True, mutants are identified regardless of their
+    status (e.g. the same mutant killed with FAIL or EXC)"""
+    frames = [
+        report.killed_frame if use_killed_mutants else report.live_frame
+        for report in reports
+    ]
+    if any(frame is None for frame in frames):
+        raise NullListFoundInReportError(ERR_NULL_LIST)
+
+    names = get_reports_names(reports)
+    return MutantsIncidence.from_frames(names, frames, by_identity=by_identity)
+
+
+def write_table(df: pd.DataFrame, output: Optional[str]):
+    """Write a table to output in csv format, or print it if output is missing"""
+    if output:
+        if not output.endswith(".csv"):
+            output += ".csv"
+        df.to_csv(output)
+    else:
+        print(df)
+
+
 class SummaryCommand(Command):
+    counts_only = True
+
     @classmethod
     def get_name(cls) -> str:
         return "summary"
@@ -154,54 +212,43 @@ class MutantsTableCommand(Command):
                 help="Where to write table in csv format; "
                 "if missing, table will be printed to stdout",
             ),
+            Argument(
+                "--incidence",
+                help="Get the table as 1/0 if the report has the mutant or not, "
+                "instead of the mutants; with --output, the mutants are written "
+                "once, in a <OUTPUT>.mutants.csv file",
+                action="store_true",
+            ),
         ]
 
-    def get_table(self, use_killed_mutants: bool):
-        """Utility method to get the mutations table;
+    def get_incidence(self, use_killed_mutants: bool) -> MutantsIncidence:
+        """Utility method to get the incidence matrix of the mutants;
         it can be used by other commands too as an
         intermediate product"""
+        return get_incidence(self.reports, use_killed_mutants)
 
-        series_list = []
-        for report in self.reports:
-            thelist = (
-                report.killed_mutants if use_killed_mutants else report.live_mutants
-            )
-
-            if thelist is None:
-                raise NullListFoundInReportError(ERR_NULL_LIST)
-
-            data = thelist
-            hash_data = [mutant.hash_string() for mutant in data]
-            hash_data_reduced = get_unique_substrings(
-                hash_data, min_length=8, max_length=16
-            )
-
-            series = pd.Series(
-                data=data, index=hash_data_reduced, name=report.hash_string()
-            )
-            series_list.append(series)
-
-        df = pd.DataFrame(series_list).T
-        df.columns = get_unique_substrings(
-            df.columns.tolist(), min_length=8, max_length=16
-        )
-        df.index.name = "Mutant"
+    def get_table(self, use_killed_mutants: bool, incidence: bool = False):
+        """Utility method to get the mutations table;
+        it can be used by other commands too as an
+        intermediate product.
 
-        return df
+        If incidence is True, cells are 1/0 instead of mutants or NaN"""
+        matrix = self.get_incidence(use_killed_mutants)
+        return matrix.to_frame() if incidence else matrix.to_table()
 
     def execute(self, *args, **kwargs) -> pd.DataFrame:
-        # transform every report in series
         use_killed_mutants = kwargs.get("killed", False)
+        incidence = kwargs.get("incidence", False)
 
-        df = self.get_table(use_killed_mutants=use_killed_mutants)
+        matrix = self.get_incidence(use_killed_mutants)
+        df = matrix.to_frame() if incidence else matrix.to_table()
 
         output: str = kwargs.get("output")
-        if output:
-            if not output.endswith(".csv"):
-                output += ".csv"
-            df.to_csv(output)
-        else:
-            print(df)
+        write_table(df, output)
+        if output and incidence:
+            if output.endswith(".csv"):
+                output = output[: -len(".csv")]
+            matrix.get_mutants_series().to_csv(output + ".mutants.csv")
 
         return df
 
@@ -216,7 +263,9 @@ class EffectivenessCommand(Command):
         return (
             "Get the effectiveness of the reports"
             " using one as base; provides at least two reports."
-            " Live mutants will be used for the calculations"
+            " Live mutants will be used for the calculations."
+            " With --all-bases or --union-bases, get the effectiveness"
+            " of every report against many bases, as a bases × reports table"
         )
 
     @classmethod
@@ -231,6 +280,22 @@ class EffectivenessCommand(Command):
                 type=int,
                 default=0,
             ),
+            Argument(
+                "--all-bases",
+                help="Use every report as base, getting a table with a row for "
+                "every base and a column for every report; reports whose "
+                "live mutants are not all in a base are NaN for that base",
+                action="store_true",
+            ),
+            Argument(
+                "--union-bases",
+                help="The zero-based indices of the reports whose live mutants "
+                "are joined in a single base, e.g. of many dev testsuites; "
+                "indices are clipped as --base-index. "
+                "Get the same table of --all-bases, with this base too",
+                type=int,
+                nargs="+",
+            ),
             Argument(
                 "-o",
                 "--output",
@@ -239,54 +304,279 @@ class EffectivenessCommand(Command):
             ),
         ]
 
+    def get_bases_table(
+        self,
+        matrix: MutantsIncidence,
+        all_bases: bool = True,
+        union_indices: Optional[List[int]] = None,
+    ) -> pd.DataFrame:
+        """Effectiveness of every report (columns) against many bases (rows):
+        every report if all_bases is True, and the union of the reports
+        of union_indices if any; all the bases are computed in one pass,
+        from the mutants shared by every base and every report"""
+        reports_rows = matrix.to_bool()
+        bases = []
+        names = []
+        if all_bases:
+            bases.append(reports_rows)
+            names.extend(matrix.names)
+        if union_indices:
+            indices = sorted({clip_index(i, len(self.reports)) for i in union_indices})
+            bases.append(reports_rows[indices].any(axis=0, keepdims=True))
+            names.append(UNION_BASE_NAME.format(indices=",".join(map(str, indices))))
+
+        bases = np.concatenate(bases)
+        shared_counts = matrix.get_intersections_counts(bases)
+        live_counts = matrix.counts()
+        total_counts = bases.sum(axis=1)
+
+        # a base is valid for a report only if it's a superset of it
+        is_superset = shared_counts == live_counts[np.newaxis, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            effectiveness = 1 - live_counts[np.newaxis, :] / total_counts[:, np.newaxis]
+
+        df = pd.DataFrame(
+            np.where(is_superset, effectiveness, np.nan),
+            index=names,
+            columns=matrix.names,
+        )
+        df.index.name = "base"
+        return df
+
     def execute(self, *args, **kwargs) -> pd.DataFrame:
         n = len(self.reports)
         min_reports_count = 2
         if n < min_reports_count:
             raise TooFewReportsProvidedError(ERR_TOO_FEW_N.format(n=min_reports_count))
 
-        # get the base table from other command - reuse code
-        base_table = MutantsTableCommand(self.reports).get_table(
-            use_killed_mutants=False
-        )
+        matrix = get_incidence(self.reports, use_killed_mutants=False)
+
+        all_bases = kwargs.get("all_bases", False)
+        union_indices = kwargs.get("union_bases")
+        if all_bases or union_indices:
+            df = self.get_bases_table(matrix, all_bases, union_indices)
+            write_table(df, kwargs.get("output"))
+            return df
 
         # if I'm here, the number of reports is ok,
-        # so I get the index of the base report to use
-        base_index = kwargs.get("base_index", 0)
+        # so I get the index of the base report to use;
+        # negative values are clipped to 0, bigger values to n - 1
+        base_index = clip_index(kwargs.get("base_index", 0), n)
+
+        # to calculate the effectiveness, every live mutant of the other reports
+        # must be found in base, otherwise the base isn't a superset of them
+        base_bits = matrix.bits[base_index]
+        if np.any(matrix.bits & ~base_bits):
+            raise NullMutantsFoundInBaseRowError(ERR_NULL_BASE_ROW)
 
-        # clip negative values to 0
-        base_index = max(base_index, 0)
+        # count live mutants of every report
+        counts = matrix.counts()
+        total_count = counts[base_index]
+        df = pd.DataFrame({"live_count": counts}, index=matrix.names)
+        df["live_total_count"] = total_count
+        df["effectiveness"] = 1 - df["live_count"] / total_count
 
-        # clip bigger values to n
-        base_index = min(base_index, n - 1)
+        write_table(df, kwargs.get("output"))
+        return df
 
-        # take the base column from the parsed dataframe
-        base_column: pd.Series = base_table.iloc[:, base_index]
 
-        # precondition is that the number of unique mutants must be equal for every row
-        # and that is true because nans will be added accordingly;
-        # furthermore, to calculate the effectiveness, we mustn't have nans in base row,
-        # because if there is a nan, there is a live mutant in report i that is not found in base
-        if base_column.hasnans:
-            raise NullMutantsFoundInBaseRowError(ERR_NULL_BASE_ROW)
-        else:
-            total_count = base_column.count()
+class SubsumptionCommand(Command):
+    @classmethod
+    def get_name(cls) -> str:
+        return "subsumption"
 
-        # count elements on rows
-        df = pd.DataFrame(base_table.count(), columns=["live_count"])
-        df["live_total_count"] = total_count
-        df["effectiveness"] = 1 - df["live_count"] / total_count
+    @classmethod
+    def get_help(cls) -> Optional[str]:
+        return (
+            "Get the dominator mutants of the reports; provides at least two"
+            " reports. A killed mutant subsumes the ones killed by every report"
+            " (testsuite) killing it, so the dominators are the mutants killed"
+            " by a minimal set of reports, one for every such set, while the"
+            " other killed mutants are redundant"
+        )
 
-        output: str = kwargs.get("output")
-        if output:
-            if not output.endswith(".csv"):
-                output += ".csv"
-            df.to_csv(output)
-        else:
-            print(df)
+    @classmethod
+    def get_arguments(cls) -> List[Argument]:
+        return [
+            Argument(
+                "--full",
+                help="Add the description of every mutant to the table",
+                action="store_true",
+            ),
+            Argument(
+                "-o",
+                "--output",
+                help="Where to write table in csv format; "
+                "if missing, table will be printed to stdout",
+            ),
+        ]
+
+    def get_subsumption_table(self, matrix: MutantsIncidence) -> pd.DataFrame:
+        """Table of the killed mutants, with the number of reports killing
+        them, the class of the mutants killed by the same reports, whether
+        the class is minimal (not subsumed by another class) and whether
+        the mutant is a dominator (the first mutant of a minimal class)"""
+        words = matrix.get_columns_words()
+
+        # mutants with identical kill vectors are in the same class
+        vectors = np.array([vector.tobytes() for vector in words], dtype=object)
+        classes, _ = pd.factorize(vectors)
+        _, first = np.unique(classes, return_index=True)
+        minimal = get_minimal_rows(words[first])
+
+        is_first = np.zeros(len(classes), dtype=bool)
+        is_first[first] = True
+
+        df = pd.DataFrame(
+            {
+                "kill_count": popcount(words.view(np.uint8)),
+                "class": classes,
+                "minimal": minimal[classes],
+                "dominator": minimal[classes] & is_first,
+            },
+            index=matrix.get_short_keys(),
+        )
+        df.index.name = "Mutant"
+        return df
+
+    def execute(self, *args, **kwargs) -> pd.DataFrame:
+        n = len(self.reports)
+        min_reports_count = 2
+        if n < min_reports_count:
+            raise TooFewReportsProvidedError(ERR_TOO_FEW_N.format(n=min_reports_count))
+
+        # the same mutant can be killed in different ways by different
+        # reports, so mutants are identified regardless of their status
+        matrix = get_incidence(self.reports, use_killed_mutants=True, by_identity=True)
+        df = self.get_subsumption_table(matrix)
+        if kwargs.get("full", False):
+            df["mutant"] = matrix.get_mutants_series().to_numpy()
+
+        dominators_count = int(df["dominator"].sum())
+        print(
+            f"Killed mutants: {len(df)}\n"
+            f"Distinct kill vectors: {df['class'].nunique()}\n"
+            f"Dominator mutants: {dominators_count}\n"
+            f"Redundant mutants: {len(df) - dominators_count}"
+        )
+
+        write_table(df, kwargs.get("output"))
+        return df
+
+
+class SimilarityCommand(Command):
+    @classmethod
+    def get_name(cls) -> str:
+        return "similarity"
+
+    @classmethod
+    def get_help(cls) -> Optional[str]:
+        return (
+            "Get the clusters of reports with similar live mutants, e.g. of"
+            " copied testsuites; provides at least two reports. Similarity"
+            " is the Jaccard of the mutants, estimated with MinHash"
+            " signatures, and similar pairs are found with LSH banding"
+        )
+
+    @classmethod
+    def get_arguments(cls) -> List[Argument]:
+        return [
+            Argument(
+                "--killed",
+                help="Use killed mutants instead of live mutants for computations",
+                action="store_true",
+            ),
+            Argument(
+                "--threshold",
+                help="The estimated Jaccard from which two reports are similar",
+                type=float,
+                default=0.8,
+            ),
+            Argument(
+                "--num-perm",
+                help="The number of values of the MinHash signatures; the more "
+                "they are, the better is the estimate of the Jaccard",
+                type=int,
+                default=MINHASH_PERMUTATIONS,
+            ),
+            Argument(
+                "-o",
+                "--output",
+                help="Where to write table in csv format; "
+                "if missing, table will be printed to stdout",
+            ),
+        ]
+
+    def get_clusters_table(
+        self,
+        use_killed_mutants: bool = False,
+        threshold: float = 0.8,
+        num_perm: int = MINHASH_PERMUTATIONS,
+    ) -> pd.DataFrame:
+        """Table of the reports with their cluster, that is the reports linked by
+        pairs whose estimated Jaccard is at least threshold; the first report
+        of every cluster is its representative, and every report has its
+        estimated Jaccard with it (1 for the representative itself).
+        Mutants are identified by their identity keys (see MutantFrame)"""
+        frames = [
+            report.killed_frame if use_killed_mutants else report.live_frame
+            for report in self.reports
+        ]
+        if any(frame is None for frame in frames):
+            raise NullListFoundInReportError(ERR_NULL_LIST)
+
+        # mutants are identified regardless of their status, as in subsumption:
+        # a mutant killed in different ways by two reports is the same element
+        signatures = get_minhash_signatures(
+            [frame.identity_keys for frame in frames], num_perm=num_perm
+        )
+        bands, rows = get_lsh_bands(num_perm, threshold)
+        pairs = get_candidate_pairs(signatures, bands, rows)
+        pairs = pairs[estimate_jaccard(signatures, pairs) >= threshold]
+
+        clusters = np.array(get_clusters(len(self.reports), pairs))
+        names = np.array(get_reports_names(self.reports), dtype=object)
+        representatives = np.stack([clusters, np.arange(len(clusters))], axis=1)
+
+        df = pd.DataFrame(
+            {
+                "cluster": clusters,
+                "cluster_size": np.bincount(clusters)[clusters],
+                "representative": names[clusters],
+                "jaccard": estimate_jaccard(signatures, representatives),
+            },
+            index=pd.Index(names, name="report"),
+        )
+        return df.sort_values("cluster", kind="stable")
+
+    def execute(self, *args, **kwargs) -> pd.DataFrame:
+        n = len(self.reports)
+        min_reports_count = 2
+        if n < min_reports_count:
+            raise TooFewReportsProvidedError(ERR_TOO_FEW_N.format(n=min_reports_count))
+
+        df = self.get_clusters_table(
+            use_killed_mutants=kwargs.get("killed", False),
+            threshold=kwargs.get("threshold", 0.8),
+            num_perm=kwargs.get("num_perm", MINHASH_PERMUTATIONS),
+        )
+
+        similar_count = int((df["cluster_size"] > 1).sum())
+        print(
+            f"Reports: {len(df)}\n"
+            f"Clusters: {df['cluster'].nunique()}\n"
+            f"Reports similar to another one: {similar_count}"
+        )
 
+        write_table(df, kwargs.get("output"))
         return df
 
 
-COMMANDS = [SummaryCommand, MutantsTableCommand, EffectivenessCommand]
+COMMANDS = [
+    SummaryCommand,
+    MutantsTableCommand,
+    EffectivenessCommand,
+    SubsumptionCommand,
+    SimilarityCommand,
+]
 COMMANDS_BY_NAME = {cmd.get_name().lower(): cmd for cmd in COMMANDS}
@@ -0,0 +1,100 @@
+from typing import Iterable, List, Optional, Type
+
+import numpy as np
+import pandas as pd
+from reports.mutants import Mutant, get_digest, get_key
+
+
+class MutantFrame:
+    """Columnar (struct-of-arrays) representation of a sequence of mutants.
+
+    Its data holds a column for every field of the mutant class
+    (including 'line'), plus the 'status' column and the 64-bit 'key'
+    column that identifies every mutant, as Mutant.key does.
+    Mutant objects are created only when asked for with to_mutants()"""
+
+    def __init__(
+        self,
+        mutant_cls: Type[Mutant],
+        data: pd.DataFrame,
+        status: Optional[str] = None,
+    ):
+        """data must have a column for each of the mutant class columns;
+        status is used to fill the 'status' column if the mutant class
+        doesn't have one (e.g. the tool reports only live mutants)"""
+        self.mutant_cls = mutant_cls
+        self.data = data.reset_index(drop=True)
+
+        if "status" not in self.data:
+            self.data["status"] = status
+
+    @classmethod
+    def from_mutants(
+        cls,
+        mutant_cls: Type[Mutant],
+        mutants: Iterable[Mutant],
+        status: Optional[str] = None,
+    ) -> "MutantFrame":
+        mutants = list(mutants)
+        data = pd.DataFrame.from_records(
+            [mutant.values() for mutant in mutants], columns=list(mutant_cls.columns)
+        )
+        data["key"] = np.fromiter(
+            (mutant.key for mutant in mutants), dtype=np.uint64, count=len(mutants)
+        )
+        return cls(mutant_cls, data, status=status)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self):
+        return f"MutantFrame({self.mutant_cls.__name__}, count={len(self)})"
+
+    def get_keys(self, columns: Iterable[str]) -> np.ndarray:
+        """The 64-bit keys of the digests of the given columns"""
+        columns = [self.data[column] for column in columns]
+        return np.fromiter(
+            (get_key(get_digest(values)) for values in zip(*columns)),
+            dtype=np.uint64,
+            count=len(self),
+        )
+
+    @property
+    def keys(self) -> np.ndarray:
+        """The 64-bit keys of the mutants, computed on first access"""
+        if "key" not in self.data:
+            self.data["key"] = self.get_keys(self.mutant_cls.hash_columns)
+        return self.data["key"].to_numpy(dtype=np.uint64)
+
+    @property
+    def identity_keys(self) -> np.ndarray:
+        """The 64-bit keys of the mutants' identity, that doesn't depend
+        on their status (see Mutant.identity_columns); they're the keys
+        if the mutant class doesn't hash the status"""
+        columns = self.mutant_cls.identity_columns
+        if columns is None:
+            return self.keys
+        if "identity_key" not in self.data:
+            self.data["identity_key"] = self.get_keys(columns)
+        return self.data["identity_key"].to_numpy(dtype=np.uint64)
+
+    @property
+    def lines(self) -> np.ndarray:
+        return self.data["line"].to_numpy(dtype=np.int64)
+
+    @property
+    def statuses(self) -> np.ndarray:
+        return self.data["status"].to_numpy()
+
+    def hash_strings(self) -> List[str]:
+        """The keys as fixed-length hex strings, i.e. the
+        first 16 characters of the mutants' hash string"""
+        return [f"{key:016x}" for key in self.keys.tolist()]
+
+    def to_mutants(self) -> List[Mutant]:
+        """Object view of the frame"""
+        columns = list(self.mutant_cls.columns)
+        return [
+            self.mutant_cls.from_values(*values)
+            for values in self.data[columns].itertuples(index=False, name=None)
+        ]
@@ -0,0 +1,210 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from reports.frame import MutantFrame
+from reports.utility import get_unique_substrings
+
+# number of set bits of every byte value
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+# rows compared at once by get_minimal_rows
+MINIMAL_BLOCK_ROWS = 1024
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """Number of set bits of every row of a bit-packed matrix"""
+    return POPCOUNT[bits].sum(axis=-1, dtype=np.int64)
+
+
+def has_subset(rows: np.ndarray, others: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Whether every row (of 64-bit words) has a subset among the others,
+    comparing only the pairs (row, other) of mask. The comparison is an
+    and-not, one word after the other, for the others still left"""
+    candidates = np.flatnonzero(mask.any(axis=0))
+    mask = mask[:, candidates]
+    for word in range(rows.shape[1]):
+        if len(candidates) == 0:
+            break
+        outside = others[candidates, word][np.newaxis] & ~rows[:, word, np.newaxis]
+        mask &= outside == 0
+        left = mask.any(axis=0)
+        candidates = candidates[left]
+        mask = mask[:, left]
+    return mask.any(axis=1)
+
+
+def get_minimal_rows(words: np.ndarray) -> np.ndarray:
+    """Which of the unique bit vectors (rows of 64-bit words) have no other
+    row that is a proper subset of them.
+
+    Rows are visited by popcount, since only rows with fewer bits can be
+    proper subsets; as every subset contains a minimal row, a row is minimal
+    if it contains none of the minimal rows found so far, that are usually
+    far fewer than the rows"""
+    counts = popcount(words.view(np.uint8))
+    order = np.argsort(counts, kind="stable")
+    words = words[order]
+    counts = counts[order]
+
+    minimal = np.zeros(len(words), dtype=bool)
+    found = words[:0]
+    for start in range(0, len(words), MINIMAL_BLOCK_ROWS):
+        stop = min(start + MINIMAL_BLOCK_ROWS, len(words))
+        rows = words[start:stop]
+
+        # unique rows with no more bits are never proper supersets
+        mask = np.ones((len(rows), len(found)), dtype=bool)
+        left = ~has_subset(rows, found, mask)
+
+        # rows of the block still left, that may contain each other
+        block_counts = counts[start:stop][left]
+        mask = block_counts[np.newaxis, :] < block_counts[:, np.newaxis]
+        left[left] = ~has_subset(rows[left], rows[left], mask)
+
+        minimal[start:stop] = left
+        found = np.concatenate([found, rows[left]])
+
+    result = np.empty_like(minimal)
+    result[order] = minimal
+    return result
+
+
+class MutantsIncidence:
+    """Bit-packed incidence matrix of reports × mutants.
+
+    Every distinct mutant (by its 64-bit key) gets a dense id, in order of
+    first appearance through the reports; every report is a row of bits,
+    set for the ids of its mutants. The mutants themselves are kept once,
+    in a frame shared by all the reports (the dictionary), whose rows are
+    in ids order and are taken from the first report having the mutant"""
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        keys: np.ndarray,
+        bits: np.ndarray,
+        mutants: MutantFrame,
+    ):
+        self.names = list(names)
+        self.keys = keys
+        self.bits = bits
+        self.mutants = mutants
+
+    @classmethod
+    def from_frames(
+        cls,
+        names: Sequence[str],
+        frames: Sequence[MutantFrame],
+        by_identity: bool = False,
+    ) -> "MutantsIncidence":
+        """Incidence of frames, one for every report name;
+        frames must be of the same mutant class.
+
+        If by_identity is True, mutants are identified by their identity
+        keys, regardless of their status (see MutantFrame.identity_keys)"""
+        if by_identity:
+            frames_keys = [frame.identity_keys for frame in frames]
+        else:
+            frames_keys = [frame.keys for frame in frames]
+        keys = pd.unique(np.concatenate(frames_keys)) if frames else np.array([])
+        keys = np.asarray(keys, dtype=np.uint64)
+        index = pd.Index(keys)
+
+        bits = np.zeros((len(frames), (len(keys) + 7) // 8), dtype=np.uint8)
+        seen = np.zeros(len(keys), dtype=bool)
+        pieces = []
+        for row, (frame, frame_keys) in enumerate(zip(frames, frames_keys)):
+            ids = index.get_indexer(frame_keys)
+            flags = np.zeros(len(keys), dtype=bool)
+            flags[ids] = True
+            bits[row] = np.packbits(flags, bitorder="little")
+
+            # ids are given in order of appearance, so new mutants
+            # are always appended to the dictionary
+            new = ~seen[ids]
+            new &= ~pd.Index(ids).duplicated()
+            seen[ids] = True
+            pieces.append(frame.data.loc[new])
+
+        if pieces:
+            data = pd.concat(pieces, ignore_index=True)
+            mutants = MutantFrame(frames[0].mutant_cls, data)
+        else:
+            mutants = None
+
+        return cls(names, keys, bits, mutants)
+
+    @property
+    def shape(self):
+        return len(self.names), len(self.keys)
+
+    def to_bool(self) -> np.ndarray:
+        """Unpacked matrix of reports × mutants"""
+        return np.unpackbits(
+            self.bits, axis=1, count=len(self.keys), bitorder="little"
+        ).astype(bool)
+
+    def counts(self) -> np.ndarray:
+        """Number of mutants of every report"""
+        return popcount(self.bits)
+
+    def get_columns_words(self) -> np.ndarray:
+        """The reports' vector of every mutant (its column in the matrix),
+        bit-packed in 64-bit words; its shape is mutants × words"""
+        packed = np.packbits(self.to_bool().T, axis=1, bitorder="little")
+        padding = -packed.shape[1] % 8
+        packed = np.pad(packed, ((0, 0), (0, padding)))
+        return np.ascontiguousarray(packed).view(np.uint64)
+
+    def get_intersections_counts(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Number of mutants shared by every row (a boolean vector over the
+        mutants' ids, every report's row by default) and every report,
+        computed at once as a matrix product"""
+        matrix = self.to_bool().astype(np.float64)
+        rows = matrix if rows is None else rows.astype(np.float64)
+        return np.rint(rows @ matrix.T).astype(np.int64)
+
+    def get_short_keys(self, min_length: int = 8, max_length: int = 16) -> List[str]:
+        """Shortest unique prefixes of the mutants' keys hex strings"""
+        if len(self.keys) == 0:
+            return []
+        strings = [f"{key:016x}" for key in self.keys.tolist()]
+        return get_unique_substrings(
+            strings, min_length=min_length, max_length=max_length
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Table of mutants × reports, with 1 if the report has the mutant"""
+        df = pd.DataFrame(
+            self.to_bool().T.astype(np.uint8),
+            index=self.get_short_keys(),
+            columns=self.names,
+        )
+        df.index.name = "Mutant"
+        return df
+
+    def to_table(self) -> pd.DataFrame:
+        """Table of mutants × reports, with the mutant object in the cells
+        of the reports having it, and NaN elsewhere"""
+        objects = np.empty(len(self.keys), dtype=object)
+        if self.mutants is not None:
+            objects[:] = self.mutants.to_mutants()
+
+        cells = np.where(self.to_bool().T, objects[:, np.newaxis], np.nan)
+        df = pd.DataFrame(
+            cells, index=self.get_short_keys(), columns=self.names, dtype=object
+        )
+        df.index.name = "Mutant"
+        return df
+
+    def get_mutants_series(self) -> pd.Series:
+        """The dictionary of mutants, as strings indexed by short keys"""
+        objects = self.mutants.to_mutants() if self.mutants is not None else []
+        return pd.Series(
+            [str(mutant) for mutant in objects],
+            index=pd.Index(self.get_short_keys(), name="Mutant"),
+            name="mutant",
+            dtype=object,
+        )
@@ -1,15 +1,42 @@
 import hashlib
 import xml.etree.ElementTree as ET
 from abc import ABC
-from collections import defaultdict
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
+from reports.utility import intern_string
+
+
+def get_digest(values: tuple) -> bytes:
+    """SHA256 digest of the string values of a hash tuple"""
+    s = b"_".join(str(e).encode("utf-8") for e in values)
+    return hashlib.sha256(s).digest()
+
+
+def get_key(digest: bytes) -> int:
+    """Compact 64-bit key made out of the first 8 bytes of a digest"""
+    return int.from_bytes(digest[:8], "big")
 
 
 class Mutant(ABC):
+    __slots__ = ("line", "_digest", "_key")
+
+    # the attributes stored in a MutantFrame, in the order of from_values arguments
+    columns: Tuple[str, ...] = ("line",)
+
+    # the attributes making up the hash tuple, in its order
+    hash_columns: Tuple[str, ...] = ("line",)
+
+    # the frame columns identifying a mutant whatever its status, e.g. the
+    # same mutant killed in different ways by different testsuites;
+    # if None, they're the hash columns (that must not include the status)
+    identity_columns: Optional[Tuple[str, ...]] = None
+
     def __init__(self, line: int):
         # assert line >= 0
         self.line = line
+        self._digest: Optional[bytes] = None
+        self._key: Optional[int] = None
 
     def hash_tuple(self) -> tuple:
         return tuple(self.hash_dict().values())
@@ -17,18 +44,53 @@ class Mutant(ABC):
     def hash_dict(self) -> dict:
         raise NotImplementedError
 
+    def freeze(self) -> "Mutant":
+        """Compute the mutant identity once, i.e. its SHA256 digest
+        and the 64-bit key made out of the first 8 bytes of it.
+        Must be called after every hash attribute is set"""
+        self._digest = get_digest(self.hash_tuple())
+        self._key = get_key(self._digest)
+        return self
+
+    @property
+    def digest(self) -> bytes:
+        """SHA256 digest of the hash tuple"""
+        if self._digest is None:
+            self.freeze()
+        return self._digest
+
+    @property
+    def key(self) -> int:
+        """Compact 64-bit identity of the mutant"""
+        if self._key is None:
+            self.freeze()
+        return self._key
+
     def hash_string(self) -> str:
         """SHA256 algorithm hex digest
         converted to string"""
-        s = b"_".join(str(e).encode("utf-8") for e in self.hash_tuple())
-        h = hashlib.sha256(s)
-        return h.hexdigest()
+        return self.digest.hex()
+
+    def values(self) -> tuple:
+        """The values of the mutant columns"""
+        return tuple(getattr(self, column) for column in self.columns)
+
+    @classmethod
+    def from_values(cls, *values) -> "Mutant":
+        """Create a mutant from the values of its columns,
+        e.g. a row of a MutantFrame"""
+        attributes = dict(zip(cls.columns, values))
+        mutant = cls(int(attributes.pop("line")))
+        for name, value in attributes.items():
+            setattr(mutant, name, intern_string(value))
+
+        return mutant.freeze()
 
     def __hash__(self):
-        return int(self.hash_string(), base=16)
+        return self.key
 
     def __eq__(self, other):
-        return type(self) is type(other) and hash(self) == hash(other)
+        return type(self) is type(other) and self.digest == other.digest
 
     def __repr__(self):
         return f"{self.__class__.__name__}{self.hash_dict()}"
@@ -38,31 +100,31 @@ class Mutant(ABC):
 
 
 class MutantWithCounter(Mutant):
-    hash_counter = defaultdict(int)
-    hash_count: int = None
+    __slots__ = ("hash_count",)
 
-    def get_hash_count(self):
-        """Method to get the current hash count.
+    def __init__(self, line: int):
+        super(MutantWithCounter, self).__init__(line)
+        self.hash_count: Optional[int] = None
+
+    def get_hash_count(self, hash_counter: Dict[tuple, int]):
+        """Method to get the current hash count from the counter
+        of the report being parsed (a defaultdict(int)).
         If it's missing from the current object, assign it"""
 
         # the key is the reduced hash tuple
         key = self.hash_tuple_reduced()
 
         # we get its current count (defaults to 0)
-        count = self.hash_counter[key]
+        count = hash_counter[key]
 
         # if we don't have it associated to the object, assign it
         if self.hash_count is None:
             self.hash_count = count
 
         # and then increment this counter
-        self.hash_counter[key] += 1
+        hash_counter[key] += 1
         return count
 
-    @classmethod
-    def reset_counter(cls):
-        cls.hash_counter = defaultdict(int)
-
     def hash_dict_reduced(self) -> dict:
         raise NotImplementedError
 
@@ -76,6 +138,11 @@ class MutantWithCounter(Mutant):
 
 
 class JudyMutant(MutantWithCounter):
+    __slots__ = ("operator", "points")
+
+    columns = ("line", "operator", "points", "hash_count")
+    hash_columns = ("line", "operator", "hash_count")
+
     operator: str
     points: int
 
@@ -83,20 +150,25 @@ class JudyMutant(MutantWithCounter):
         return dict(line=self.line, operator=self.operator)
 
     @classmethod
-    def from_dict(cls, thedict: dict) -> "JudyMutant":
+    def from_dict(cls, thedict: dict, hash_counter: Dict[tuple, int]) -> "JudyMutant":
         operator = thedict["operators"][0]
         points = thedict["points"][0]
         line = thedict["lines"][0]
 
         mutant = cls(int(line))
-        mutant.operator = operator
+        mutant.operator = intern_string(operator)
         mutant.points = int(points)
-        mutant.get_hash_count()
+        mutant.get_hash_count(hash_counter)
 
-        return mutant
+        return mutant.freeze()
 
 
 class JumbleMutant(MutantWithCounter):
+    __slots__ = ("description", "class_under_mutation")
+
+    columns = ("line", "class_under_mutation", "description", "hash_count")
+    hash_columns = ("line", "description", "hash_count")
+
     description: str
     class_under_mutation: str
 
@@ -104,17 +176,52 @@ class JumbleMutant(MutantWithCounter):
         return dict(line=self.line, description=self.description)
 
     @classmethod
-    def from_tuple(cls, thetuple: tuple) -> "JumbleMutant":
+    def from_tuple(
+        cls, thetuple: tuple, hash_counter: Dict[tuple, int]
+    ) -> "JumbleMutant":
         theclass, line, description = thetuple
         mutant = cls(int(line))
-        mutant.class_under_mutation = theclass
-        mutant.description = description
-        mutant.get_hash_count()
+        mutant.class_under_mutation = intern_string(theclass)
+        mutant.description = intern_string(description)
+        mutant.get_hash_count(hash_counter)
 
-        return mutant
+        return mutant.freeze()
 
 
 class MajorMutant(MutantWithCounter):
+    __slots__ = (
+        "status",
+        "operator",
+        "original",
+        "mutated",
+        "signature",
+        "description",
+    )
+
+    columns = (
+        "line",
+        "status",
+        "operator",
+        "original",
+        "mutated",
+        "signature",
+        "description",
+        "hash_count",
+    )
+    hash_columns = columns
+
+    # identity_count is a frame column only, numbering the mutants that share
+    # the other identity columns in order of appearance, whatever their status
+    identity_columns = (
+        "line",
+        "operator",
+        "original",
+        "mutated",
+        "signature",
+        "description",
+        "identity_count",
+    )
+
     status: str
     operator: str
     original: str
@@ -145,23 +252,59 @@ class MajorMutant(MutantWithCounter):
         )
 
     @classmethod
-    def from_series(cls, row: pd.Series) -> "MajorMutant":
+    def from_series(
+        cls, row: pd.Series, hash_counter: Dict[tuple, int]
+    ) -> "MajorMutant":
         line = row.LineNumber
         mutant = cls(int(line))
 
-        mutant.status = row.Status
-        mutant.operator = row.Operator
-        mutant.original = row.From
-        mutant.mutated = row.To
-        mutant.signature = row.Signature
-        mutant.description = row.Description
+        mutant.status = intern_string(row.Status)
+        mutant.operator = intern_string(row.Operator)
+        mutant.original = intern_string(row.From)
+        mutant.mutated = intern_string(row.To)
+        mutant.signature = intern_string(row.Signature)
+        mutant.description = intern_string(row.Description)
 
-        mutant.get_hash_count()
+        mutant.get_hash_count(hash_counter)
 
-        return mutant
+        return mutant.freeze()
 
 
 class PitMutant(Mutant):
+    __slots__ = (
+        "detected",
+        "status",
+        "mutated_class",
+        "mutated_method",
+        "method_description",
+        "mutator",
+        "description",
+        "index",
+        "block",
+    )
+
+    columns = (
+        "line",
+        "detected",
+        "status",
+        "mutated_class",
+        "mutated_method",
+        "method_description",
+        "mutator",
+        "description",
+        "index",
+        "block",
+    )
+    hash_columns = (
+        "line",
+        "mutated_class",
+        "mutated_method",
+        "method_description",
+        "mutator",
+        "description",
+        "block",
+    )
+
     xml2py_bool = {"true": True, "false": False}
 
     # XML 'mutation' attributes
@@ -190,20 +333,26 @@ class PitMutant(Mutant):
 
     @classmethod
     def from_xml_element(cls, element: ET.Element) -> "PitMutant":
-        line = element.find("lineNumber").text
+        fields = {child.tag: child.text for child in element}
+        return cls.from_fields(element.attrib, fields)
+
+    @classmethod
+    def from_fields(cls, attribs: dict, fields: dict) -> "PitMutant":
+        """Create a mutant from the 'mutation' element attributes
+        and the mapping of its children tags to their text"""
+        line = fields["lineNumber"]
         mutant = cls(int(line))
 
-        attribs = element.attrib
         mutant.detected = mutant.xml2py_bool[attribs["detected"]]
-        mutant.status = attribs["status"]
+        mutant.status = intern_string(attribs["status"])
 
-        mutant.mutated_class = element.find("mutatedClass").text
-        mutant.mutated_method = element.find("mutatedMethod").text
-        mutant.method_description = element.find("methodDescription").text
-        mutant.mutator = element.find("mutator").text
-        mutant.description = element.find("description").text
+        mutant.mutated_class = intern_string(fields["mutatedClass"])
+        mutant.mutated_method = intern_string(fields["mutatedMethod"])
+        mutant.method_description = intern_string(fields["methodDescription"])
+        mutant.mutator = intern_string(fields["mutator"])
+        mutant.description = intern_string(fields["description"])
 
-        mutant.index = int(element.find("index").text)
-        mutant.block = int(element.find("block").text)
+        mutant.index = int(fields["index"])
+        mutant.block = int(fields["block"])
 
-        return mutant
+        return mutant.freeze()
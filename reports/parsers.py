@@ -0,0 +1,173 @@
+import contextlib
+import functools
+import json
+import mmap
+import os
+import pathlib
+import re
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+JUMBLE_FAIL = rb"M FAIL:\s*([a-zA-Z.]+):(\d+):\s*([^\r\n]+)"
+
+# a token is either a FAIL record, or a run of non-whitespace characters
+# (the killed mutants' dots) that stops where a FAIL record begins
+JUMBLE_TOKEN_PATTERN = re.compile(JUMBLE_FAIL + rb"|((?:(?!" + JUMBLE_FAIL + rb")\S)+)")
+JUMBLE_CLASS_PATTERN = re.compile(rb"Mutating ([^\r\n]+)")
+JUMBLE_START_PATTERN = re.compile(
+    rb"Mutation points = \d+, unit test time limit \d+\.\d+s"
+)
+JUMBLE_END_PATTERN = re.compile(rb"Jumbling took \d+\.\d+s")
+JUMBLE_ERROR_PATTERN = re.compile(rb"Score: \d+%(\s*\(([\w\s]+)\))?")
+
+PIT_DETECTED_PATTERN = re.compile(rb"<mutation\s[^>]*?detected\s*=\s*['\"](\w+)['\"]")
+PIT_CLASS_PATTERN = re.compile(rb"<mutatedClass>([^<]*)</mutatedClass>")
+
+# the class of a mutants.log row, i.e. the left part of its signature
+# (the fifth field), before both the method and the subclass separators
+MAJOR_LOG_ROW_PATTERN = re.compile(
+    rb"^\d+:[^:\r\n]*:[^:\r\n]*:[^:\r\n]*:([^:@$\r\n]*)", re.MULTILINE
+)
+MAJOR_KILL_ROW_PATTERN = re.compile(rb"^\s*\d+\s*,\s*(\w+)", re.MULTILINE)
+
+
+class JumbleOutput(NamedTuple):
+    class_under_mutation: Optional[str]
+    error: Optional[str]
+    killed_count: int
+    live_count: int
+    fails: List[Tuple[str, str, str]]
+
+
+class MutantsCounts(NamedTuple):
+    """Counts-only scan of a report, made without creating its mutants"""
+
+    classes: Set[str]
+    killed_count: int
+    live_count: int
+
+
+@contextlib.contextmanager
+def open_mmap(filepath: Union[str, os.PathLike]):
+    """Open a file as a read-only memory map;
+    empty files, that cannot be mapped, give an empty bytes object"""
+    with open(filepath, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b""
+            return
+
+        try:
+            yield buffer
+        finally:
+            buffer.close()
+
+
+def scan_jumble_output(
+    filepath: Union[str, os.PathLike], counts_only: bool = False
+) -> JumbleOutput:
+    """Scan a Jumble output file in a single pass over its memory map.
+
+    The mutations text is found between the start and end markers;
+    in there every FAIL record is a live mutant (as a tuple of class,
+    line and description), while every other non-whitespace character
+    is a killed mutant. If Jumble reported an error, its message is
+    returned and the mutations are not scanned.
+    If counts_only is True, FAIL records are counted but not collected."""
+
+    with open_mmap(filepath) as buffer:
+        match = JUMBLE_CLASS_PATTERN.search(buffer)
+        class_under_mutation = match.group(1).decode() if match else None
+
+        match = JUMBLE_ERROR_PATTERN.search(buffer)
+        if match is None:
+            raise ValueError(f"Score not found in Jumble output {filepath}")
+        if match.group(2):
+            error = match.group(2).decode()
+            return JumbleOutput(class_under_mutation, error, 0, 0, [])
+
+        start = JUMBLE_START_PATTERN.search(buffer)
+        if start is None:
+            raise ValueError(f"Mutations start not found in Jumble output {filepath}")
+        end = JUMBLE_END_PATTERN.search(buffer, start.end())
+        if end is None:
+            raise ValueError(f"Mutations end not found in Jumble output {filepath}")
+
+        killed_count = 0
+        live_count = 0
+        fails = []
+        for token in JUMBLE_TOKEN_PATTERN.finditer(buffer, start.end(), end.start()):
+            if token.lastindex == 4:
+                killed_count += token.end() - token.start()
+            else:
+                live_count += 1
+                if not counts_only:
+                    fails.append(tuple(g.decode() for g in token.group(1, 2, 3)))
+
+    return JumbleOutput(class_under_mutation, None, killed_count, live_count, fails)
+
+
+def count_pit_mutations(filepath: Union[str, os.PathLike]) -> MutantsCounts:
+    """Count the detected (killed) and not detected (live) mutations
+    of a Pit XML report, scanning its 'mutation' start tags
+    and 'mutatedClass' elements without parsing the XML"""
+    with open_mmap(filepath) as buffer:
+        detected = [m.group(1) for m in PIT_DETECTED_PATTERN.finditer(buffer)]
+        classes = {m.group(1).decode() for m in PIT_CLASS_PATTERN.finditer(buffer)}
+
+    killed_count = detected.count(b"true")
+    return MutantsCounts(classes, killed_count, len(detected) - killed_count)
+
+
+def count_major_mutants(
+    log_filepath: Union[str, os.PathLike], kill_filepath: Union[str, os.PathLike]
+) -> MutantsCounts:
+    """Count the mutants of a Major mutants.log, and the live ones
+    among them as the LIVE rows of its kill.csv;
+    an empty kill.csv means that every mutant is live"""
+    with open_mmap(log_filepath) as buffer:
+        classes = set()
+        total_count = 0
+        for match in MAJOR_LOG_ROW_PATTERN.finditer(buffer):
+            classes.add(match.group(1).decode())
+            total_count += 1
+
+    with open_mmap(kill_filepath) as buffer:
+        statuses = [m.group(1) for m in MAJOR_KILL_ROW_PATTERN.finditer(buffer)]
+
+    live_count = statuses.count(b"LIVE") if statuses else total_count
+    return MutantsCounts(classes, total_count - live_count, live_count)
+
+
+class JudyResult:
+    """A Judy result.json decoded once, with its
+    class entries indexed by class name"""
+
+    def __init__(self, result: dict):
+        self.operators: List[dict] = result.get("operators", [])
+        self.classes: List[dict] = result.get("classes", [])
+
+        self.index: Dict[str, List[dict]] = defaultdict(list)
+        for entry in self.classes:
+            self.index[entry["name"]].append(entry)
+
+    def get_class_entries(self, name: str) -> List[dict]:
+        """Get every class entry with the provided name;
+        a well-formed result has exactly one of them"""
+        return self.index.get(name, [])
+
+    @classmethod
+    def load(cls, filepath: Union[str, os.PathLike]) -> "JudyResult":
+        """Load a result.json; results are cached by path, size and
+        modification time, so every class under mutation of the same
+        file reuses the same decoded result"""
+        path = pathlib.Path(filepath).resolve()
+        stat = path.stat()
+        return _load_judy_result(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_judy_result(filepath: str, size: int, mtime_ns: int) -> JudyResult:
+    with open(filepath) as f:
+        return JudyResult(json.load(f))
@@ -1,16 +1,22 @@
 import datetime
-import hashlib
-import json
 import os
 import pathlib
-import re
 import xml.etree.ElementTree as ET
 from abc import ABC
-from collections import Counter
-from typing import List, Optional, Set, Union
+from collections import Counter, defaultdict
+from typing import Iterator, List, Optional, Set, Tuple, Type, Union
 
 import pandas as pd
+from reports.cache import ReportCache
+from reports.frame import MutantFrame
 from reports.mutants import JudyMutant, JumbleMutant, MajorMutant, Mutant, PitMutant
+from reports.parsers import (
+    JudyResult,
+    count_major_mutants,
+    count_pit_mutations,
+    scan_jumble_output,
+)
+from reports.utility import get_files_fingerprint
 
 ERR_EXTRACT = (
     "An exception was raised when extracting the content of {fp}.\n"
@@ -82,18 +88,225 @@ class WrongTagInPitReportError(PitReportError):
 
 class Report(ABC):
     class_under_mutation: str
+    mutant_cls: Type[Mutant] = Mutant
 
-    def __init__(self):
-        self._created_at = datetime.datetime.now()
+    # whether the tool reports the killed/live mutants themselves,
+    # and not only their count
+    reports_killed_mutants: bool = True
+    reports_live_mutants: bool = True
 
-        self.killed_mutants: Optional[List[Mutant]] = None
-        self.live_mutants: Optional[List[Mutant]] = None
+    def __init__(
+        self,
+        cache: Optional[ReportCache] = None,
+        fast_fingerprint: bool = False,
+        lazy: bool = False,
+    ):
+        """If lazy is True, only the mutants counts and the class under
+        mutation are scanned on creation; mutants are parsed
+        the first time they are needed"""
+        self._created_at = datetime.datetime.now()
+        self._hash_string: Optional[str] = None
+        self.fast_fingerprint = fast_fingerprint
+        self.cache = cache
+        self.lazy = lazy
+        self._parsed = False
+
+        # the class under mutation known before parsing (e.g. with Judy)
+        self._cache_class = getattr(self, "class_under_mutation", None)
+
+        self._killed_mutants: Optional[List[Mutant]] = None
+        self._live_mutants: Optional[List[Mutant]] = None
+        self._killed_frame: Optional[MutantFrame] = None
+        self._live_frame: Optional[MutantFrame] = None
         self._killed_mutants_count: Optional[int] = None
         self._live_mutants_count: Optional[int] = None
 
+    @property
+    def killed_mutants(self) -> Optional[List[Mutant]]:
+        """The killed mutants list; if it was not set during
+        extraction, it's created on first access"""
+        self.ensure_parsed()
+        if self._killed_mutants is None:
+            self._killed_mutants = self.make_killed_mutants()
+        return self._killed_mutants
+
+    @killed_mutants.setter
+    def killed_mutants(self, mutants: Optional[List[Mutant]]):
+        self._killed_mutants = mutants
+
+    @property
+    def live_mutants(self) -> Optional[List[Mutant]]:
+        """The live mutants list; if it was not set during
+        extraction, it's created on first access"""
+        self.ensure_parsed()
+        if self._live_mutants is None:
+            self._live_mutants = self.make_live_mutants()
+        return self._live_mutants
+
+    @live_mutants.setter
+    def live_mutants(self, mutants: Optional[List[Mutant]]):
+        self._live_mutants = mutants
+
+    @property
+    def killed_frame(self) -> Optional[MutantFrame]:
+        """The killed mutants in columnar form; if it was not
+        set during extraction, it's created on first access"""
+        self.ensure_parsed()
+        if self._killed_frame is None:
+            self._killed_frame = self.make_killed_frame()
+        return self._killed_frame
+
+    @property
+    def live_frame(self) -> Optional[MutantFrame]:
+        """The live mutants in columnar form; if it was not
+        set during extraction, it's created on first access"""
+        self.ensure_parsed()
+        if self._live_frame is None:
+            self._live_frame = self.make_live_frame()
+        return self._live_frame
+
+    def make_killed_mutants(self) -> Optional[List[Mutant]]:
+        """Lazy creation of killed mutants, as
+        object view of the killed frame"""
+        if self._killed_frame is None:
+            return None
+        return self._killed_frame.to_mutants()
+
+    def make_live_mutants(self) -> Optional[List[Mutant]]:
+        """Lazy creation of live mutants, as
+        object view of the live frame"""
+        if self._live_frame is None:
+            return None
+        return self._live_frame.to_mutants()
+
+    def make_killed_frame(self) -> Optional[MutantFrame]:
+        """Lazy creation of the killed frame
+        from the killed mutants"""
+        if self._killed_mutants is None:
+            return None
+        return MutantFrame.from_mutants(
+            self.mutant_cls, self._killed_mutants, status="KILLED"
+        )
+
+    def make_live_frame(self) -> Optional[MutantFrame]:
+        """Lazy creation of the live frame
+        from the live mutants"""
+        if self._live_mutants is None:
+            return None
+        return MutantFrame.from_mutants(
+            self.mutant_cls, self._live_mutants, status="LIVE"
+        )
+
+    def load(self):
+        """Parse the report, or only scan its counts if it's lazy"""
+        if self.lazy:
+            self.scan(self.cache)
+        else:
+            self.parse(self.cache)
+
+    def ensure_parsed(self):
+        """Parse a lazy report the first time its mutants are needed"""
+        if not self._parsed:
+            # counts will be set again by the extraction
+            self._killed_mutants_count = None
+            self._live_mutants_count = None
+            self.parse(self.cache)
+
+    def get_cache_key(self) -> tuple:
+        """The key of the report in cache: its tool, its hash and
+        its class under mutation, if known before parsing"""
+        return (
+            self.__class__.__name__,
+            self.hash_string(),
+            self._cache_class,
+        )
+
+    def parse(self, cache: Optional[ReportCache] = None):
+        """Extract the report content and check it; if a cache is
+        provided, the parsed state is loaded from it when available,
+        otherwise it's stored in it after the extraction"""
+        self._parsed = True
+
+        if cache is not None:
+            key = self.get_cache_key()
+            state = cache.load(*key)
+            if state is not None:
+                self.load_state(state)
+                return
+
+        self.do_extract()
+        self.sanity_check()
+
+        if cache is not None:
+            cache.store(*key, self.dump_state())
+
+    def scan(self, cache: Optional[ReportCache] = None):
+        """Get only the mutants counts and the class under mutation,
+        without creating mutants; if a cache is provided and has
+        the parsed state, it's loaded instead"""
+        if cache is not None:
+            state = cache.load(*self.get_cache_key())
+            if state is not None:
+                self._parsed = True
+                self.load_state(state)
+                return
+
+        self.do_scan_counts()
+
+    def do_extract(self):
+        """Run the report extraction"""
+        raise NotImplementedError
+
+    def do_scan_counts(self):
+        """Run the report counts scan"""
+        raise NotImplementedError
+
+    def scan_counts(self):
+        """Set the mutants counts and the class under mutation;
+        it defaults to the full parsing, when the tool
+        has no counts-only scanner"""
+        self.ensure_parsed()
+
+    def dump_state(self) -> dict:
+        """The parsed state of the report, that is its class
+        under mutation, its mutants counts and its frames"""
+        state = dict(
+            class_under_mutation=self.class_under_mutation,
+            killed_count=self.killed_mutants_count,
+            live_count=self.live_mutants_count,
+        )
+
+        for name, frame in (("killed", self.killed_frame), ("live", self.live_frame)):
+            if frame is not None:
+                frame.keys  # compute the keys to store them too
+                state[name] = frame.data
+            else:
+                state[name] = None
+
+        return state
+
+    def load_state(self, state: dict):
+        """Restore a state got from dump_state"""
+        self.class_under_mutation = state["class_under_mutation"]
+        self._killed_mutants_count = state["killed_count"]
+        self._live_mutants_count = state["live_count"]
+
+        if state["killed"] is not None:
+            self._killed_frame = MutantFrame(self.mutant_cls, state["killed"])
+        if state["live"] is not None:
+            self._live_frame = MutantFrame(self.mutant_cls, state["live"])
+
     def hash_string(self) -> str:
         """Hash algorithm hex digest
-        converted to string"""
+        converted to string; it's computed once per report"""
+        if self._hash_string is None:
+            self._hash_string = get_files_fingerprint(
+                self.get_filepaths(), fast=self.fast_fingerprint
+            )
+        return self._hash_string
+
+    def get_filepaths(self) -> List[pathlib.Path]:
+        """The report files, whose content makes up the report hash"""
         raise NotImplementedError
 
     def __hash__(self) -> int:
@@ -114,12 +327,16 @@ class Report(ABC):
             f"Mutation score:       {mutscore}",
         ]
 
-        for mutants_arr, mutants_str in zip(
-            [self.killed_mutants, self.live_mutants], ["Killed", "Live"]
+        # mutants are needed (and parsed, if lazy) only if they are printed
+        for mutants_type, reported, count in (
+            ("killed", self.reports_killed_mutants, self.killed_mutants_count),
+            ("live", self.reports_live_mutants, self.live_mutants_count),
         ):
-            if mutants_arr:
+            mutants_str = mutants_type.capitalize()
+            if reported and count > 0:
                 buffer.append(f"{mutants_str} mutants report:")
                 if print_mutants:
+                    mutants_arr = getattr(self, f"{mutants_type}_mutants")
                     buffer.append("\n".join(str(m) for m in mutants_arr))
                 else:
                     buffer.append("< SNIP >")
@@ -137,6 +354,15 @@ class Report(ABC):
         return set([m for m in mutants if hash(m) in duplicates])
 
     def sanity_check(self):
+        """Check for overlapping mutants and class under mutation"""
+        self.check_overlapping_mutants()
+
+        if not self.class_under_mutation:
+            raise ReportError(
+                "Cannot set class under mutation! Maybe input report was broken?"
+            )
+
+    def check_overlapping_mutants(self):
         """Check for overlapping mutants"""
         if self.killed_mutants:
             set_killed = self.find_overlapping_mutants(self.killed_mutants)
@@ -148,26 +374,21 @@ class Report(ABC):
             if set_live:
                 raise OverlappingMutantsError(set_live)
 
-        if not self.class_under_mutation:
-            raise ReportError(
-                "Cannot set class under mutation! Maybe input report was broken?"
-            )
-
     @property
     def killed_mutants_count(self) -> int:
-        if self.killed_mutants is not None:
-            return len(self.killed_mutants)
-        elif self._killed_mutants_count is not None:
+        if self._killed_mutants_count is not None:
             return self._killed_mutants_count
+        elif self.killed_mutants is not None:
+            return len(self.killed_mutants)
         else:
             raise MissingMutantCountException()
 
     @property
     def live_mutants_count(self) -> int:
-        if self.live_mutants is not None:
-            return len(self.live_mutants)
-        elif self._live_mutants_count is not None:
+        if self._live_mutants_count is not None:
             return self._live_mutants_count
+        elif self.live_mutants is not None:
+            return len(self.live_mutants)
         else:
             raise MissingMutantCountException()
 
@@ -185,21 +406,34 @@ class Report(ABC):
 
 
 class SingleFileReport(Report):
-    def __init__(self, filepath: Union[str, os.PathLike]):
-        super(SingleFileReport, self).__init__()
+    def __init__(
+        self,
+        filepath: Union[str, os.PathLike],
+        cache: Optional[ReportCache] = None,
+        fast_fingerprint: bool = False,
+        lazy: bool = False,
+    ):
+        super(SingleFileReport, self).__init__(
+            cache=cache, fast_fingerprint=fast_fingerprint, lazy=lazy
+        )
 
         self.filepath = pathlib.Path(filepath)
+        self.load()
+
+    def do_extract(self):
         try:
             self.extract()
         except Exception:
             raise ReportError(ERR_EXTRACT.format(fp=self.filepath))
 
-        self.sanity_check()
+    def do_scan_counts(self):
+        try:
+            self.scan_counts()
+        except Exception:
+            raise ReportError(ERR_EXTRACT.format(fp=self.filepath))
 
-    def hash_string(self):
-        content = open(self.filepath, "rb").read()
-        h = hashlib.md5(content)
-        return h.hexdigest()
+    def get_filepaths(self) -> List[pathlib.Path]:
+        return [self.filepath]
 
     def extract(self, **kwargs):
         raise NotImplementedError
@@ -211,21 +445,34 @@ class SingleFileReport(Report):
 
 
 class MultipleFilesReport(Report):
-    def __init__(self, *filepaths: Union[str, os.PathLike]):
-        super(MultipleFilesReport, self).__init__()
+    def __init__(
+        self,
+        *filepaths: Union[str, os.PathLike],
+        cache: Optional[ReportCache] = None,
+        fast_fingerprint: bool = False,
+        lazy: bool = False,
+    ):
+        super(MultipleFilesReport, self).__init__(
+            cache=cache, fast_fingerprint=fast_fingerprint, lazy=lazy
+        )
 
         self.filepaths = [pathlib.Path(fp) for fp in filepaths]
+        self.load()
+
+    def do_extract(self):
         try:
             self.extract_multiple()
         except Exception:
             raise ReportError(ERR_EXTRACT_MULT.format(fps=self.filepaths))
 
-        self.sanity_check()
+    def do_scan_counts(self):
+        try:
+            self.scan_counts()
+        except Exception:
+            raise ReportError(ERR_EXTRACT_MULT.format(fps=self.filepaths))
 
-    def hash_string(self):
-        content = b"\n".join(open(fp, "rb").read() for fp in self.filepaths)
-        h = hashlib.md5(content)
-        return h.hexdigest()
+    def get_filepaths(self) -> List[pathlib.Path]:
+        return self.filepaths
 
     def extract_multiple(self, **kwargs):
         raise NotImplementedError
@@ -237,25 +484,38 @@ class MultipleFilesReport(Report):
 
 
 class JudyReport(SingleFileReport):
-    def __init__(self, filepath: Union[str, os.PathLike], class_under_mutation: str):
+    mutant_cls = JudyMutant
+    reports_killed_mutants = False
+
+    def __init__(
+        self,
+        filepath: Union[str, os.PathLike],
+        class_under_mutation: str,
+        result: Optional[JudyResult] = None,
+        cache: Optional[ReportCache] = None,
+        fast_fingerprint: bool = False,
+        lazy: bool = False,
+    ):
+        # an already decoded result can be provided, otherwise the
+        # (cached) result of the file will be used
         self.class_under_mutation = class_under_mutation
-        super(JudyReport, self).__init__(filepath)
+        self.result = result
+        super(JudyReport, self).__init__(
+            filepath, cache=cache, fast_fingerprint=fast_fingerprint, lazy=lazy
+        )
 
     def __repr__(self):
         return "Judy" + super(JudyReport, self).__repr__()
 
-    def extract(self):
-        judy_dict = json.loads(open(self.filepath).read())
+    def get_class_entry(self) -> dict:
+        result = self.result or JudyResult.load(self.filepath)
 
-        classes = judy_dict["classes"]
-        if not classes:
+        if not result.classes:
             raise EmptyJudyReportError(
                 "No mutated class found! There were some errors in execution phase"
             )
 
-        thedict = [
-            adict for adict in classes if adict["name"] == self.class_under_mutation
-        ]
+        thedict = result.get_class_entries(self.class_under_mutation)
 
         if len(thedict) == 0:
             raise MissingClassFromJudyReportError(
@@ -266,81 +526,118 @@ class JudyReport(SingleFileReport):
                 f"{self.class_under_mutation} found multiple times!"
             )
         else:
-            thedict = thedict[0]
+            return thedict[0]
 
-        JudyMutant.reset_counter()
+    def scan_counts(self):
+        thedict = self.get_class_entry()
+        self._killed_mutants_count = thedict["mutantsKilledCount"]
+        self._live_mutants_count = len(thedict["notKilledMutant"])
+
+    def extract(self):
+        thedict = self.get_class_entry()
+        hash_counter = defaultdict(int)
         self._killed_mutants_count = thedict["mutantsKilledCount"]
         self.live_mutants = [
-            JudyMutant.from_dict(mdict) for mdict in thedict["notKilledMutant"]
+            JudyMutant.from_dict(mdict, hash_counter)
+            for mdict in thedict["notKilledMutant"]
         ]
 
 
 class JumbleReport(SingleFileReport):
+    mutant_cls = JumbleMutant
+    reports_killed_mutants = False
+
     def __repr__(self):
         return "Jumble" + super(JumbleReport, self).__repr__()
 
-    def extract(self):
-        content = open(self.filepath).read()
-
-        class_pattern = re.compile(r"Mutating (.+)")
-        self.class_under_mutation = class_pattern.search(content).group(1)
-
-        fail_pattern = re.compile(r"M FAIL:\s*([a-zA-Z.]+):(\d+):\s*(.+)")
-        start_pattern = re.compile(
-            r"Mutation points = \d+, unit test time limit \d+\.\d+s"
-        )
-        end_pattern = re.compile(r"Jumbling took \d+\.\d+s")
-        error_pattern = re.compile(r"Score: \d+%\s*\(?([\w ]+)?")
+    def scan_counts(self):
+        output = scan_jumble_output(self.filepath, counts_only=True)
+        self.class_under_mutation = output.class_under_mutation
 
-        # check if there were some errors with Jumble
-        errmsg = error_pattern.search(content).group(1)
-        if errmsg:
-            raise JumbleReportError(errmsg)
+        if output.error:
+            raise JumbleReportError(output.error)
 
-        i = start_pattern.search(content).end()
-        j = end_pattern.search(content[i:]).start() + i
+        self._killed_mutants_count = output.killed_count
+        self._live_mutants_count = output.live_count
 
-        # this is the actual text regarding mutations
-        text = content[i:j]
+    def extract(self):
+        output = scan_jumble_output(self.filepath)
+        self.class_under_mutation = output.class_under_mutation
 
-        # subtract from text all the fails + get count of them
-        killed_text, live_mutants_count = fail_pattern.subn("", text)
-        killed_mutants_count = len(re.sub(r"\s+", "", killed_text))
+        # check if there were some errors with Jumble
+        if output.error:
+            raise JumbleReportError(output.error)
 
-        JumbleMutant.reset_counter()
-        self._killed_mutants_count = killed_mutants_count
+        hash_counter = defaultdict(int)
+        self._killed_mutants_count = output.killed_count
         self.live_mutants = [
-            JumbleMutant.from_tuple(atuple) for atuple in fail_pattern.findall(text)
+            JumbleMutant.from_tuple(atuple, hash_counter) for atuple in output.fails
         ]
-        assert self.live_mutants_count == live_mutants_count
 
 
 class MajorReport(MultipleFilesReport):
+    mutant_cls = MajorMutant
+
     def __init__(
         self,
         mutation_log_fp: Union[str, os.PathLike],
         kill_csv_fp: Union[str, os.PathLike],
+        cache: Optional[ReportCache] = None,
+        fast_fingerprint: bool = False,
+        lazy: bool = False,
     ):
-        super(MajorReport, self).__init__(mutation_log_fp, kill_csv_fp)
+        super(MajorReport, self).__init__(
+            mutation_log_fp,
+            kill_csv_fp,
+            cache=cache,
+            fast_fingerprint=fast_fingerprint,
+            lazy=lazy,
+        )
+
+    # from mutants.log and kill.csv columns to MajorMutant columns
+    frame_columns = {
+        "LineNumber": "line",
+        "Status": "status",
+        "Operator": "operator",
+        "From": "original",
+        "To": "mutated",
+        "Signature": "signature",
+        "Description": "description",
+    }
 
     def __repr__(self):
         return "Major" + super(MajorReport, self).__repr__()
 
-    def extract_multiple(self):
+    def get_log_and_csv(self) -> Tuple[pathlib.Path, pathlib.Path]:
+        """Get mutants.log and kill.csv, in this order"""
         if len(self.filepaths) != 2:
             raise MajorReportError(
                 "Two files must be provided! kill.csv and mutants.log"
             )
 
         first_fp, second_fp = self.filepaths
-        first_fp_first_line = open(first_fp).read().splitlines()[0]
+        with open(first_fp) as f:
+            first_fp_first_line = f.readline()
 
         # if we find the colon in first file, this is mutants.log file
         if ":" in first_fp_first_line:
-            logfile, csvfile = first_fp, second_fp
+            return first_fp, second_fp
         # otherwise mutants.log is the second file
         else:
-            logfile, csvfile = second_fp, first_fp
+            return second_fp, first_fp
+
+    def scan_counts(self):
+        counts = count_major_mutants(*self.get_log_and_csv())
+        if len(counts.classes) > 1:
+            raise MultipleClassUnderMutationError("Multiple classes mutated!")
+        else:
+            self.class_under_mutation = counts.classes.pop()
+
+        self._killed_mutants_count = counts.killed_count
+        self._live_mutants_count = counts.live_count
+
+    def extract_multiple(self):
+        logfile, csvfile = self.get_log_and_csv()
 
         columns = ["MutantNo", "Status"]
         kill_df = pd.read_csv(csvfile, header=0, names=columns).set_index(columns[0])
@@ -361,63 +658,143 @@ class MajorReport(MultipleFilesReport):
         # fix mismatch in length
         if kill_df.empty or len(kill_df) == 0:
             # empty kill csv -> all mutants are live
-            kill_df = pd.DataFrame(["LIVE"] * len(mutants_df), columns=["Status"])
-            kill_df.index.name = "MutantNo"
+            kill_df = pd.DataFrame(
+                {"Status": "LIVE"}, index=mutants_df.index, columns=["Status"]
+            )
 
-        df = mutants_df.join(kill_df)
-        live_mutants = df.loc[df.Status == "LIVE"]
-        killed_mutants = df.loc[df.index.difference(live_mutants.index)]
-        live_count = len(live_mutants)
-        killed_count = len(killed_mutants)
-        assert len(df) == live_count + killed_count
+        df = mutants_df.join(kill_df).rename(columns=self.frame_columns)
 
-        MajorMutant.reset_counter()
-        self.live_mutants = []
-        self.killed_mutants = []
-        classes = []
-
-        for index, row in df.iterrows():
-            mutant = MajorMutant.from_series(row)
-            cls = mutant.signature.split("@")[0]  # get the left part of class@method
-            cls = cls.split("$")[0]  # get the left part of class$subclass
-            classes.append(cls)
-            if mutant.status == "LIVE":
-                self.live_mutants.append(mutant)
-            else:
-                self.killed_mutants.append(mutant)
+        # the counter fixes different mutants sharing the same reduced hash tuple,
+        # numbering them in order of appearance (as MajorMutant.get_hash_count)
+        reduced_columns = list(self.frame_columns.values())
+        df["hash_count"] = df.groupby(
+            reduced_columns, sort=False, dropna=False
+        ).cumcount()
+
+        # the same counter, regardless of the status, for the mutants' identity
+        identity_columns = [column for column in reduced_columns if column != "status"]
+        df["identity_count"] = df.groupby(
+            identity_columns, sort=False, dropna=False
+        ).cumcount()
 
-        if len(set(classes)) > 1:
+        # get the left part of class@method, then the left part of class$subclass
+        classes = df.signature.str.split("@", n=1).str[0].str.split("$", n=1).str[0]
+        if classes.nunique(dropna=False) > 1:
             raise MultipleClassUnderMutationError("Multiple classes mutated!")
         else:
-            self.class_under_mutation = set(classes).pop()
+            self.class_under_mutation = classes.iloc[0]
+
+        is_live = df.status == "LIVE"
+        df = df[list(MajorMutant.columns) + ["identity_count"]]
+        self._live_frame = MutantFrame(MajorMutant, df.loc[is_live])
+        self._killed_frame = MutantFrame(MajorMutant, df.loc[~is_live])
+        self._live_mutants_count = len(self._live_frame)
+        self._killed_mutants_count = len(self._killed_frame)
+        assert len(df) == self._live_mutants_count + self._killed_mutants_count
+
+    def check_overlapping_mutants(self):
+        """Check for overlapping mutants on the frames,
+        without creating the mutants"""
+        for frame in (self._killed_frame, self._live_frame):
+            overlapping = frame.data.loc[
+                frame.data.duplicated(list(MajorMutant.columns), keep=False)
+            ]
+            if not overlapping.empty:
+                raise OverlappingMutantsError(overlapping)
 
 
 class PitReport(SingleFileReport):
+    mutant_cls = PitMutant
+
+    def __init__(
+        self,
+        filepath: Union[str, os.PathLike],
+        streaming: bool = True,
+        cache: Optional[ReportCache] = None,
+        fast_fingerprint: bool = False,
+        lazy: bool = False,
+    ):
+        # streaming parsing keeps memory usage flat regardless of the report size;
+        # set it to False to build the whole XML tree before extraction
+        self.streaming = streaming
+        super(PitReport, self).__init__(
+            filepath, cache=cache, fast_fingerprint=fast_fingerprint, lazy=lazy
+        )
+
     def __repr__(self):
         return "Pit" + super(PitReport, self).__repr__()
 
-    def extract(self):
+    def iter_mutants(self) -> Iterator[PitMutant]:
+        """Iterate over the mutants found in the XML report"""
+        if self.streaming:
+            return self._iter_mutants_streaming()
+        else:
+            return self._iter_mutants_tree()
+
+    def _iter_mutants_tree(self) -> Iterator[PitMutant]:
         tree = ET.parse(self.filepath)
         root = tree.getroot()
         elements: List[ET.Element] = list(root)
 
-        self.live_mutants = []
-        self.killed_mutants = []
-        classes = []
-
         for element in elements:
             if element.tag != "mutation":
                 msg = f"Expecting 'mutation' element, got {element.tag}"
                 raise WrongTagInPitReportError(msg)
 
-            mutant = PitMutant.from_xml_element(element)
-            classes.append(mutant.mutated_class)
+            yield PitMutant.from_xml_element(element)
+
+    def _iter_mutants_streaming(self) -> Iterator[PitMutant]:
+        """Incremental parsing of the XML report; every mutant is created
+        when its 'mutation' end tag is reached, then its element is
+        cleared, so only one mutation at time is kept in memory"""
+        root = None
+        depth = 0
+        fields = {}
+
+        for event, element in ET.iterparse(self.filepath, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = element
+                elif depth == 2 and element.tag != "mutation":
+                    msg = f"Expecting 'mutation' element, got {element.tag}"
+                    raise WrongTagInPitReportError(msg)
+                continue
+
+            depth -= 1
+            if depth == 2:
+                # end of a 'mutation' child, e.g. lineNumber
+                fields[element.tag] = element.text
+            elif depth == 1:
+                # end of the 'mutation' element
+                yield PitMutant.from_fields(element.attrib, fields)
+                fields = {}
+                element.clear()
+                root.clear()
+
+    def scan_counts(self):
+        counts = count_pit_mutations(self.filepath)
+        if len(counts.classes) > 1:
+            raise MultipleClassUnderMutationError("Multiple classes mutated!")
+        else:
+            self.class_under_mutation = counts.classes.pop()
+
+        self._killed_mutants_count = counts.killed_count
+        self._live_mutants_count = counts.live_count
+
+    def extract(self):
+        self.live_mutants = []
+        self.killed_mutants = []
+        classes = set()
+
+        for mutant in self.iter_mutants():
+            classes.add(mutant.mutated_class)
             if mutant.detected:
                 self.killed_mutants.append(mutant)
             else:
                 self.live_mutants.append(mutant)
 
-        if len(set(classes)) > 1:
+        if len(classes) > 1:
             raise MultipleClassUnderMutationError("Multiple classes mutated!")
         else:
-            self.class_under_mutation = set(classes).pop()
+            self.class_under_mutation = classes.pop()
@@ -0,0 +1,118 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+MINHASH_SEED = 0
+MINHASH_PERMUTATIONS = 128
+
+EMPTY_SIGNATURE_VALUE = np.iinfo(np.uint64).max
+
+
+def mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer over an array of 64-bit values"""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def get_minhash_signatures(
+    keys_list: Sequence[np.ndarray],
+    num_perm: int = MINHASH_PERMUTATIONS,
+    seed: int = MINHASH_SEED,
+) -> np.ndarray:
+    """MinHash signatures (a row of num_perm values) of sets of 64-bit keys.
+
+    Every hash function is the mix of the key xor a random seed; keys
+    shared by many sets (as mutants in many reports) are hashed only once.
+    Empty sets have every value of the signature set to its maximum"""
+    seeds = np.random.default_rng(seed).integers(
+        0, EMPTY_SIGNATURE_VALUE, size=num_perm, dtype=np.uint64, endpoint=True
+    )
+
+    all_keys = np.concatenate([np.asarray(keys, dtype=np.uint64) for keys in keys_list])
+    unique_keys, inverse = np.unique(all_keys, return_inverse=True)
+    hashes = mix(unique_keys[:, np.newaxis] ^ seeds[np.newaxis, :])
+
+    signatures = np.full(
+        (len(keys_list), num_perm), EMPTY_SIGNATURE_VALUE, dtype=np.uint64
+    )
+    start = 0
+    for row, keys in enumerate(keys_list):
+        stop = start + len(keys)
+        if stop > start:
+            signatures[row] = hashes[inverse[start:stop]].min(axis=0)
+        start = stop
+
+    return signatures
+
+
+def get_lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Number of bands and of rows per band for LSH banding of signatures;
+    two signatures become candidates with probability 1/2 around a Jaccard
+    of (1 / bands) ** (1 / rows), chosen as the closest one not above the
+    threshold, so that few similar pairs are missed"""
+    options = [(num_perm // rows, rows) for rows in range(1, num_perm + 1)]
+    options = [(bands, rows) for bands, rows in options if bands * rows == num_perm]
+
+    def get_threshold(option: Tuple[int, int]) -> float:
+        bands, rows = option
+        return (1 / bands) ** (1 / rows)
+
+    below = [option for option in options if get_threshold(option) <= threshold]
+    if not below:
+        return min(options, key=get_threshold)
+    return max(below, key=get_threshold)
+
+
+def get_candidate_pairs(signatures: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """Pairs (i, j) with i < j of the signatures that are equal in at
+    least one band; equal bands are found hashing their bytes"""
+    pairs = set()
+    for band in range(bands):
+        values = signatures[:, band * rows : (band + 1) * rows]
+        buckets = np.array([value.tobytes() for value in values], dtype=object)
+        codes, _ = pd.factorize(buckets)
+
+        # the signatures of a bucket are contiguous, once sorted by code
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        for bucket in np.split(order, bounds):
+            if len(bucket) > 1:
+                indices = bucket.tolist()
+                pairs.update(
+                    (indices[i], j)
+                    for i in range(len(indices))
+                    for j in indices[i + 1 :]
+                )
+
+    return np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2)
+
+
+def estimate_jaccard(signatures: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """Estimated Jaccard of every pair of signatures, as
+    the fraction of their values that are equal"""
+    first = signatures[pairs[:, 0]]
+    second = signatures[pairs[:, 1]]
+    return (first == second).mean(axis=1)
+
+
+def get_clusters(count: int, pairs: np.ndarray) -> List[int]:
+    """Connected components of count items linked by pairs, with a
+    union-find; every item is labeled with the smallest item of its cluster"""
+    parents = list(range(count))
+
+    def find(item: int) -> int:
+        while parents[item] != item:
+            parents[item] = parents[parents[item]]
+            item = parents[item]
+        return item
+
+    for first, second in pairs.tolist():
+        root1, root2 = find(first), find(second)
+        if root1 != root2:
+            parents[max(root1, root2)] = min(root1, root2)
+
+    return [find(item) for item in range(count)]
@@ -1,8 +1,12 @@
 import base64
+import functools
+import hashlib
 import logging
+import os
 import pathlib
 import subprocess
-from typing import List, Optional
+import sys
+from typing import Iterable, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__file__)
 
@@ -73,6 +77,64 @@ def get_defects4j_modified_classes(project: str, bug: str) -> List[str]:
         return open(path).read().splitlines(keepends=False)
 
 
+def intern_string(value):
+    """Intern the value if it's a string, so that values repeated across
+    mutants (classes, methods, operators, descriptions) are stored once"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+FINGERPRINT_SAMPLES = 16
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+
+
+def get_files_fingerprint(
+    filepaths: Iterable[Union[str, os.PathLike]], fast: bool = False
+) -> str:
+    """Get the MD5 hex digest of the files' contents, joined by a newline;
+    files are read in chunks, and fingerprints are memoized against
+    path, size and modification time of every file.
+
+    If fast is True, only the size, the modification time and some sampled
+    blocks of each file are hashed, so that big files are not read whole"""
+    signatures = []
+    for fp in filepaths:
+        path = pathlib.Path(fp).resolve()
+        stat = path.stat()
+        signatures.append((str(path), stat.st_size, stat.st_mtime_ns))
+
+    return _get_files_fingerprint(tuple(signatures), fast)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_files_fingerprint(signatures: Tuple[Tuple[str, int, int]], fast: bool) -> str:
+    h = hashlib.md5()
+
+    for i, (path, size, mtime_ns) in enumerate(signatures):
+        if i > 0:
+            h.update(b"\n")
+
+        with open(path, "rb") as f:
+            if not fast:
+                read_chunk = functools.partial(f.read, FINGERPRINT_CHUNK_SIZE)
+                for chunk in iter(read_chunk, b""):
+                    h.update(chunk)
+                continue
+
+            h.update(f"{size}:{mtime_ns}:".encode("utf-8"))
+            if size <= FINGERPRINT_SAMPLES * FINGERPRINT_SAMPLE_SIZE:
+                h.update(f.read())
+                continue
+
+            # evenly spaced blocks, including the first and the last one
+            step = (size - FINGERPRINT_SAMPLE_SIZE) / (FINGERPRINT_SAMPLES - 1)
+            for j in range(FINGERPRINT_SAMPLES):
+                f.seek(int(j * step))
+                h.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+
+    return h.hexdigest()
+
+
 def get_base64(astring: str) -> str:
     """Converts a string to its base64 version"""
     return base64.b64encode(astring.encode("utf-8")).decode("utf-8")
@@ -103,17 +165,19 @@ def get_unique_substrings(
     if max_len < 1:
         raise ValueError("Cannot get unique substrings for empty strings")
 
+    # the prefixes of two different strings are different once they're
+    # longer than their common prefix, while equal strings are never told
+    # apart; after sorting, the longest common prefix of a string with any
+    # other one is the one with a neighbor, so only neighbors are compared
+    # and the characters needed only grow (to max_len + 1 at most)
     characters_needed = 1
-    substrings = [s[:characters_needed] for s in strings]
-
-    # loop while the length of input array
-    # is different from the length of the set
-    # made out of the input array;
-    # e.g. if substrings is ["a", "b", "c", "a"], its length is 4
-    # while its set is {"a", "b", "c"}, with a length of 3
-    while len(substrings) != len(set(substrings)) and characters_needed <= max_len:
-        characters_needed += 1
-        substrings = [s[:characters_needed] for s in strings]
+    sorted_strings = sorted(strings)
+    for s1, s2 in zip(sorted_strings, sorted_strings[1:]):
+        while (
+            characters_needed <= max_len
+            and s1[:characters_needed] == s2[:characters_needed]
+        ):
+            characters_needed += 1
 
     if characters_needed > max_len and on_equal == "raise":
         raise ValueError("Strings are equal!")
@@ -1,9 +1,11 @@
 import argparse
 import pathlib
 import re
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
-from typing import List
+from typing import List, Optional, Type
 
+from reports.cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_SIZE, ReportCache
 from reports.commands import COMMANDS, COMMANDS_BY_NAME
 from reports.reports import (
     JudyReport,
@@ -32,7 +34,25 @@ def check_pattern(arg_value: str, pattern: re.Pattern):
 check_bug_pattern = partial(check_pattern, pattern=re.compile(r"^\d+$"))
 
 
-def get_reports(project: str, bug: str, tool: str, files: List[str]) -> List[Report]:
+def make_report(tool_cls: Type[Report], args: tuple, kwargs: dict) -> Report:
+    """Parse a report; it's a module function so that
+    it can be executed in a worker process"""
+    return tool_cls(*args, **kwargs)
+
+
+def get_reports(
+    project: str,
+    bug: str,
+    tool: str,
+    files: List[str],
+    cache: Optional[ReportCache] = None,
+    fast_fingerprint: bool = False,
+    jobs: int = 1,
+    lazy: bool = False,
+) -> List[Report]:
+    """Parse the reports of files, in the same order;
+    if jobs is greater than 1, they are parsed in that many worker processes.
+    If lazy is True, only their counts are scanned (see Report.lazy)"""
     # get modified classes from defects4j framework
     # if there are 2+, raise an error
     # else get the single class under mutation
@@ -57,7 +77,11 @@ def get_reports(project: str, bug: str, tool: str, files: List[str]) -> List[Rep
             f"{tool_cls} is neither single file nor multiple files report!"
         )
 
-    parsed_reports = []
+    kwargs = dict(cache=cache, fast_fingerprint=fast_fingerprint, lazy=lazy)
+    if issubclass(tool_cls, JudyReport):
+        kwargs.update(class_under_mutation=class_under_mutation)
+
+    reports_args = []
 
     for file in files:
         # convert the file to a Path object
@@ -80,13 +104,22 @@ def get_reports(project: str, bug: str, tool: str, files: List[str]) -> List[Rep
             if len(files) < 2:
                 raise OSError(ERR_EXP_MULT_FILES.format(n=len(files)))
 
-            report = tool_cls(*files)
+            reports_args.append(tuple(files))
         else:
-            if issubclass(tool_cls, JudyReport):
-                report = tool_cls(path, class_under_mutation=class_under_mutation)
-            else:
-                report = tool_cls(path)
+            reports_args.append((path,))
+
+    # every report is parsed on its own, with its own parsing state,
+    # so they can be parsed in parallel; map returns them in input order
+    n = len(reports_args)
+    if jobs > 1 and n > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, n)) as executor:
+            parsed_reports = list(
+                executor.map(make_report, [tool_cls] * n, reports_args, [kwargs] * n)
+            )
+    else:
+        parsed_reports = [make_report(tool_cls, args, kwargs) for args in reports_args]
 
+    for report in parsed_reports:
         if report.class_under_mutation != class_under_mutation:
             raise ReportError(
                 ERR_CLASS.format(
@@ -94,8 +127,6 @@ def get_reports(project: str, bug: str, tool: str, files: List[str]) -> List[Rep
                 )
             )
 
-        parsed_reports.append(report)
-
     return parsed_reports
 
 
@@ -114,6 +145,19 @@ HELP_FILES = (
     "The space-separated list of reports to study;"
     " if working with a multiple files report, provide its directory"
 )
+HELP_CACHE_DIR = "The directory where parsed reports are cached"
+HELP_CACHE_MAX_SIZE = (
+    "The maximum size of the cache, in MiB;"
+    " least recently used reports are evicted when exceeded"
+)
+HELP_NO_CACHE = "Always parse reports, without using the cache"
+HELP_FAST_FINGERPRINT = (
+    "Identify reports by size, modification time and sampled blocks"
+    " of their files, instead of hashing them whole"
+)
+HELP_JOBS = "The number of worker processes used to parse reports"
+
+MIB = 1024 * 1024
 
 ERR_NO_CMD = "Must provide a command to run!"
 ERR_MULT_CLASSES = (
@@ -144,6 +188,22 @@ if __name__ == "__main__":
     # specify the list of files to parse into reports
     parser.add_argument("files", help=HELP_FILES, nargs="+", type=pathlib.Path)
 
+    # specify the cache of parsed reports
+    parser.add_argument("--cache-dir", help=HELP_CACHE_DIR, default=DEFAULT_CACHE_DIR)
+    parser.add_argument(
+        "--cache-max-size",
+        help=HELP_CACHE_MAX_SIZE,
+        type=int,
+        default=DEFAULT_CACHE_MAX_SIZE // MIB,
+    )
+    parser.add_argument("--no-cache", help=HELP_NO_CACHE, action="store_true")
+    parser.add_argument(
+        "--fast-fingerprint", help=HELP_FAST_FINGERPRINT, action="store_true"
+    )
+
+    # specify the parallelism of reports parsing
+    parser.add_argument("-j", "--jobs", help=HELP_JOBS, type=int, default=1)
+
     # subparsers for commands
     parser2 = argparse.ArgumentParser()
     subparsers = parser2.add_subparsers(title="Commands", dest="command")
@@ -159,10 +219,11 @@ if __name__ == "__main__":
     # parse args
     args = parser2.parse_args()
 
-    # get the reports
-    _reports = get_reports(
-        project=args.project, bug=args.bug, tool=args.tool, files=args.files
-    )
+    # get the cache
+    if args.no_cache:
+        _cache = None
+    else:
+        _cache = ReportCache(args.cache_dir, max_size=args.cache_max_size * MIB)
 
     # get the selected command from args
     command_str = args.command.lower()
@@ -170,6 +231,18 @@ if __name__ == "__main__":
     # get the corresponding class
     command_cls = COMMANDS_BY_NAME[command_str]
 
+    # get the reports
+    _reports = get_reports(
+        project=args.project,
+        bug=args.bug,
+        tool=args.tool,
+        files=args.files,
+        cache=_cache,
+        fast_fingerprint=args.fast_fingerprint,
+        jobs=args.jobs,
+        lazy=command_cls.counts_only,
+    )
+
     # and then the object, using the reports
     command = command_cls(_reports)
 
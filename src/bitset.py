@@ -0,0 +1,94 @@
+from typing import Dict, Hashable, Iterator, List, Mapping, Sequence
+
+import numpy as np
+
+from src.summary import KINDS
+
+
+def to_bitmap(ids: Sequence[int], size: int) -> int:
+    """Bitmap (as a Python int) with the bits of ids set"""
+    flags = np.zeros(size, dtype=bool)
+    flags[np.asarray(ids, dtype=np.int64)] = True
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+def from_bitmap(bitmap: int, size: int) -> np.ndarray:
+    """The ids whose bits are set in a bitmap, in order"""
+    data = np.frombuffer(bitmap.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder="little")[:size])
+
+
+def popcount(bitmap: int) -> int:
+    return bin(bitmap).count("1")
+
+
+class MutantsBitsets(Mapping):
+    """Set algebra of two sequences of unique mutants over bitmaps.
+
+    Every distinct mutant gets a dense integer id (first sequence
+    mutants first, in order), and every side is the bitmap of its ids;
+    so set operations are word-level operations over Python ints,
+    and their counts are popcounts.
+    As a mapping, it gives the mutants of every kind (see summary.KINDS),
+    materialized on first access and in ids order; mutants shared
+    by both sequences are the objects of the first one"""
+
+    def __init__(self, first_seq: Sequence[Hashable], second_seq: Sequence[Hashable]):
+        self.first_seq = first_seq
+        self.second_seq = second_seq
+
+        ids: Dict[Hashable, int] = {}
+        first_ids = [ids.setdefault(mutant, len(ids)) for mutant in first_seq]
+        second_ids = [ids.setdefault(mutant, len(ids)) for mutant in second_seq]
+
+        self.mutants: List[Hashable] = list(ids)
+        self.size = len(self.mutants)
+
+        self.first = to_bitmap(first_ids, self.size)
+        self.second = to_bitmap(second_ids, self.size)
+
+        # materialized kinds
+        self._views: Dict[str, Sequence[Hashable]] = {}
+
+    def get_bitmap(self, kind: str) -> int:
+        if kind == "first":
+            return self.first
+        elif kind == "second":
+            return self.second
+        elif kind == "intersection":
+            return self.first & self.second
+        elif kind == "union":
+            return self.first | self.second
+        elif kind == "first_diff":
+            return self.first & ~self.second
+        elif kind == "second_diff":
+            return self.second & ~self.first
+        elif kind == "xor":
+            return self.first ^ self.second
+        else:
+            raise KeyError(kind)
+
+    def count(self, kind: str) -> int:
+        """Count of the mutants of a kind, without materializing them"""
+        return popcount(self.get_bitmap(kind))
+
+    def get_counts(self) -> Dict[str, int]:
+        return {kind: self.count(kind) for kind in KINDS}
+
+    def __getitem__(self, kind: str) -> Sequence[Hashable]:
+        if kind not in self._views:
+            if kind == "first":
+                view = self.first_seq
+            elif kind == "second":
+                view = self.second_seq
+            else:
+                ids = from_bitmap(self.get_bitmap(kind), self.size)
+                view = [self.mutants[i] for i in ids.tolist()]
+            self._views[kind] = view
+        return self._views[kind]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(KINDS)
+
+    def __len__(self) -> int:
+        return len(KINDS)
@@ -0,0 +1,328 @@
+import bisect
+import difflib
+from typing import Dict, Hashable, Iterator, List, NamedTuple, Sequence, Tuple
+
+ALGORITHMS = ("difflib", "myers", "patience")
+DEFAULT_ALGORITHM = "difflib"
+
+# edits searched from each end of a region by Myers' algorithm
+# before falling back to difflib; it bounds the time to O((N + M) * cost)
+MYERS_MAX_COST = 512
+
+ERR_ALGORITHM = "Invalid diff algorithm '{algorithm}'! Must be one of {algorithms}"
+
+
+class Hunk(NamedTuple):
+    """A changed region of a diff: the source lines [i1, i2)
+    are replaced by the destination lines [j1, j2) (0-based)"""
+
+    i1: int
+    i2: int
+    j1: int
+    j2: int
+
+    @property
+    def source_count(self) -> int:
+        return self.i2 - self.i1
+
+    @property
+    def destination_count(self) -> int:
+        return self.j2 - self.j1
+
+    @property
+    def source_line(self) -> int:
+        """1-based source line, as in unified diff headers;
+        if no line is removed, it's the line before the change"""
+        return self.i1 + 1 if self.source_count else self.i1
+
+    @property
+    def destination_line(self) -> int:
+        """1-based destination line, as in unified diff headers;
+        if no line is added, it's the line before the change"""
+        return self.j1 + 1 if self.destination_count else self.j1
+
+
+Match = Tuple[int, int]
+
+
+class _CostExceeded(Exception):
+    """Raised when an edit script would cost more than the allowed one"""
+
+
+def _myers(
+    a: Sequence[int], b: Sequence[int], max_cost: int = MYERS_MAX_COST
+) -> List[Match]:
+    """Matching pairs (i, j) of a shortest edit script, with the linear space
+    refinement of Myers' algorithm: the middle snake of the script is found
+    searching from both ends at once, then the regions before and after it
+    are diffed the same way. It takes O((N + M) D) time and O(N + M) memory.
+
+    Lines found in one side only never match, so they are dropped before
+    diffing; this doesn't change the script, but makes very different
+    sides cheap. _CostExceeded is raised if a middle snake needs more than
+    max_cost edits from each end"""
+    a_lines, b_lines = set(a), set(b)
+    a_indices = [i for i, line in enumerate(a) if line in b_lines]
+    b_indices = [j for j, line in enumerate(b) if line in a_lines]
+    a = [a[i] for i in a_indices]
+    b = [b[j] for j in b_indices]
+
+    matches = []
+    regions = [(0, len(a), 0, len(b))]
+    while regions:
+        alo, ahi, blo, bhi = regions.pop()
+
+        # common prefix and suffix of the region
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            matches.append((alo, blo))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            matches.append((ahi, bhi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        x1, y1, x2, y2 = _middle_snake(a, b, alo, ahi, blo, bhi, max_cost)
+        matches.extend((x1 + i, y1 + i) for i in range(x2 - x1))
+        regions.append((alo, x1, blo, y1))
+        regions.append((x2, ahi, y2, bhi))
+
+    matches.sort()
+    return [(a_indices[i], b_indices[j]) for i, j in matches]
+
+
+def _middle_snake(
+    a: Sequence[int],
+    b: Sequence[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+    max_cost: int,
+) -> Tuple[int, int, int, int]:
+    """Start and end (x1, y1, x2, y2) of the middle snake of a region;
+    the furthest reaching paths from the end are kept in reverse
+    coordinates, where the forward diagonal k is delta - k"""
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta % 2 != 0
+    forward = {1: 0}
+    backward = {1: 0}
+
+    for d in range((n + m + 1) // 2 + 1):
+        if d > max_cost:
+            raise _CostExceeded()
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[k - 1] < forward[k + 1]):
+                x = forward[k + 1]
+            else:
+                x = forward[k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            forward[k] = x
+            if odd and abs(delta - k) <= d - 1 and x + backward[delta - k] >= n:
+                return alo + x0, blo + y0, alo + x, blo + y
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[k - 1] < backward[k + 1]):
+                x = backward[k + 1]
+            else:
+                x = backward[k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            backward[k] = x
+            if not odd and abs(delta - k) <= d and x + forward[delta - k] >= n:
+                return ahi - x, bhi - y, ahi - x0, bhi - y0
+
+    raise AssertionError("Should not reach this LoC")
+
+
+def _difflib_matches(a: Sequence[int], b: Sequence[int]) -> List[Match]:
+    """Matching pairs (i, j) of difflib.SequenceMatcher"""
+    blocks = difflib.SequenceMatcher(None, a, b).get_matching_blocks()
+    return [(i + offset, j + offset) for i, j, size in blocks for offset in range(size)]
+
+
+def _myers_or_difflib(a: Sequence[int], b: Sequence[int]) -> List[Match]:
+    """Matching pairs of Myers' algorithm, or of difflib if too costly"""
+    try:
+        return _myers(a, b)
+    except _CostExceeded:
+        return _difflib_matches(a, b)
+
+
+def _patience(a: Sequence[int], b: Sequence[int]) -> List[Match]:
+    """Matching pairs (i, j) anchored on the longest increasing sequence
+    of lines unique in both sides; regions without unique lines
+    are diffed with Myers' algorithm (or difflib, if too costly)"""
+    matches = []
+    _patience_region(a, b, 0, len(a), 0, len(b), matches)
+    return matches
+
+
+def _patience_region(
+    a: Sequence[int],
+    b: Sequence[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+    matches: List[Match],
+):
+    # common prefix and suffix of the region
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        matches.append((alo, blo))
+        alo += 1
+        blo += 1
+    suffix = []
+    while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+        suffix.append((ahi, bhi))
+
+    if alo < ahi and blo < bhi:
+        anchors = _get_anchors(a, b, alo, ahi, blo, bhi)
+        if not anchors:
+            region_matches = _myers_or_difflib(a[alo:ahi], b[blo:bhi])
+            offset = [(i + alo, j + blo) for i, j in region_matches]
+            matches.extend(offset)
+        else:
+            for i, j in anchors:
+                _patience_region(a, b, alo, i, blo, j, matches)
+                matches.append((i, j))
+                alo, blo = i + 1, j + 1
+            _patience_region(a, b, alo, ahi, blo, bhi, matches)
+
+    matches.extend(reversed(suffix))
+
+
+def _get_anchors(
+    a: Sequence[int], b: Sequence[int], alo: int, ahi: int, blo: int, bhi: int
+) -> List[Match]:
+    """Longest increasing sequence of the lines unique in both regions,
+    found with patience sorting"""
+    counts: Dict[int, List[int]] = {}
+    for i in range(alo, ahi):
+        counts.setdefault(a[i], [0, -1, 0, -1])
+        entry = counts[a[i]]
+        entry[0] += 1
+        entry[1] = i
+    for j in range(blo, bhi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[2] += 1
+            entry[3] = j
+
+    unique = sorted(
+        (i, j) for count_a, i, count_b, j in counts.values() if count_a == count_b == 1
+    )
+
+    # piles top values, with the index of the pair on top of each pile
+    tops: List[int] = []
+    top_indices: List[int] = []
+    previous: List[int] = []
+    for index, (_, j) in enumerate(unique):
+        pile = bisect.bisect_left(tops, j)
+        previous.append(top_indices[pile - 1] if pile else -1)
+        if pile == len(tops):
+            tops.append(j)
+            top_indices.append(index)
+        else:
+            tops[pile] = j
+            top_indices[pile] = index
+
+    anchors = []
+    index = top_indices[-1] if top_indices else -1
+    while index != -1:
+        anchors.append(unique[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _get_ids(
+    a: Sequence[Hashable], b: Sequence[Hashable]
+) -> Tuple[List[int], List[int]]:
+    """Replace lines with integer ids, that are faster to compare"""
+    ids: Dict[Hashable, int] = {}
+    a_ids = [ids.setdefault(line, len(ids)) for line in a]
+    b_ids = [ids.setdefault(line, len(ids)) for line in b]
+    return a_ids, b_ids
+
+
+def _hunks_from_matches(matches: List[Match], n: int, m: int) -> Iterator[Hunk]:
+    i = j = 0
+    for mi, mj in matches + [(n, m)]:
+        if mi > i or mj > j:
+            yield Hunk(i, mi, j, mj)
+        i, j = mi + 1, mj + 1
+
+
+def get_hunks(
+    a: Sequence[Hashable], b: Sequence[Hashable], algorithm: str = DEFAULT_ALGORITHM
+) -> Iterator[Hunk]:
+    """Get the hunks of the diff between two sequences of lines,
+    in order and without context lines.
+
+    algorithm is one of:
+    - 'difflib' (the default), the hunks of difflib.unified_diff with n=0,
+      exactly; line remapping and difference sets are the same as ever,
+      but it can be slow on large, repetitive sources
+    - 'myers', a shortest edit script
+    - 'patience', anchored on unique lines, robust with repetitive sources
+    Myers and patience skip the common prefix and suffix of the sequences
+    before diffing, and their hunks can differ from difflib ones (so can
+    remapped lines and difference sets); Myers falls back to difflib
+    matches when the edit script is too costly (see MYERS_MAX_COST)"""
+    algorithm = algorithm.lower()
+    if algorithm not in ALGORITHMS:
+        raise ValueError(
+            ERR_ALGORITHM.format(algorithm=algorithm, algorithms=ALGORITHMS)
+        )
+
+    if algorithm == "difflib":
+        # no fast path for common prefix and suffix: skipping them can change
+        # the longest blocks difflib matches first, so its hunks; only
+        # identical sides are known to have none
+        if len(a) == len(b) and all(x == y for x, y in zip(a, b)):
+            return
+
+        # the same groups (and so hunks' ranges) of unified_diff
+        matcher = difflib.SequenceMatcher(None, a, b)
+        for group in matcher.get_grouped_opcodes(0):
+            first, last = group[0], group[-1]
+            yield Hunk(first[1], last[2], first[3], last[4])
+        return
+
+    # fast path for identical prefix and suffix
+    n, m = len(a), len(b)
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    limit = min(n, m) - prefix
+    while suffix < limit and a[n - suffix - 1] == b[m - suffix - 1]:
+        suffix += 1
+
+    a = a[prefix : n - suffix]
+    b = b[prefix : m - suffix]
+    if not a and not b:
+        return
+
+    a_ids, b_ids = _get_ids(a, b)
+    find_matches = _myers_or_difflib if algorithm == "myers" else _patience
+    hunks = _hunks_from_matches(find_matches(a_ids, b_ids), len(a), len(b))
+
+    for hunk in hunks:
+        yield Hunk(
+            hunk.i1 + prefix, hunk.i2 + prefix, hunk.j1 + prefix, hunk.j2 + prefix
+        )
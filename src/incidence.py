@@ -0,0 +1,59 @@
+import pathlib
+from typing import List, Tuple, Union
+
+import pandas as pd
+
+INCIDENCE_SUFFIX = ".incidence.csv"
+MUTANTS_SUFFIX = ".mutants.csv"
+
+
+def get_key_string(key: int) -> str:
+    """Short key of a mutant, as the hex of its 64-bit key"""
+    return f"{key:016x}"
+
+
+def get_incidence_paths(prefix: Union[str, pathlib.Path]) -> Tuple[pathlib.Path, ...]:
+    """Paths of the incidence table and of its mutants dictionary"""
+    prefix = str(prefix)
+    incidence_path = pathlib.Path(prefix + INCIDENCE_SUFFIX)
+    mutants_path = pathlib.Path(prefix + MUTANTS_SUFFIX)
+    return incidence_path, mutants_path
+
+
+def write_incidence(series: List[pd.Series], prefix: Union[str, pathlib.Path]):
+    """Write the mutants series of many groups in compact form.
+
+    Every series is a row of the incidence table, whose columns are the
+    mutants short keys (the hex of Mutant.key, in the same format of the
+    reports package keys) and whose values are True if the group has the
+    mutant, False otherwise; series data must be the mutants themselves.
+    The description of every mutant is written once, in a side dictionary
+    of short keys"""
+    incidence_path, mutants_path = get_incidence_paths(prefix)
+
+    rows = []
+    descriptions = {}
+    for s in series:
+        mutants = s.tolist()
+        keys = [get_key_string(mutant.key) for mutant in mutants]
+        rows.append(pd.Series(True, index=keys, name=s.name, dtype=bool))
+        for key, mutant in zip(keys, mutants):
+            descriptions.setdefault(key, str(mutant))
+
+    incidence = pd.DataFrame(rows).fillna(False).astype(bool)
+    incidence.to_csv(incidence_path, index_label="group")
+
+    mutants = pd.Series(descriptions, name="mutant", dtype=object)
+    mutants.to_csv(mutants_path, index_label="key")
+
+
+def read_incidence(prefix: Union[str, pathlib.Path]) -> pd.DataFrame:
+    """Read the incidence table written by write_incidence, as booleans"""
+    incidence_path, _ = get_incidence_paths(prefix)
+    return pd.read_csv(incidence_path, index_col=0).astype(bool)
+
+
+def read_mutants(prefix: Union[str, pathlib.Path]) -> pd.Series:
+    """Read the mutants dictionary written by write_incidence"""
+    _, mutants_path = get_incidence_paths(prefix)
+    return pd.read_csv(mutants_path, index_col=0, dtype=str)["mutant"]
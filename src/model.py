@@ -1,40 +1,89 @@
+import bisect
+import copy
 import datetime
-import difflib
 import hashlib
 import logging
 import os
 import pathlib
 from abc import ABC
 from collections import Counter
-from typing import Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from reports.cache import ReportCache
+from reports.utility import get_files_fingerprint
 
+from src.bitset import MutantsBitsets
+from src.diff import DEFAULT_ALGORITHM, Hunk, get_hunks
 from src.exception import OverlappingMutantError
+from src.summary import KINDS, DirectorySummarySink, SummarySink
 
 
 class Mutant(ABC):
+    __slots__ = ("_line", "original_line", "_digest", "_key")
+
     def __init__(self, line: int):
         # assert line >= 0
         self.line = line
         self.original_line = line
 
+    @property
+    def line(self) -> int:
+        return self._line
+
+    @line.setter
+    def line(self, value: int):
+        # line is part of the hash tuple, so the identity must be computed again
+        self._line = value
+        self._digest = None
+        self._key = None
+
     @property
     def hash_tuple(self) -> tuple:
         raise NotImplementedError
 
-    def __hash__(self):
+    def with_line(self, line: int) -> "Mutant":
+        """A copy of the mutant at another line, leaving this one untouched"""
+        mutant = copy.copy(self)
+        mutant.line = line
+        return mutant
+
+    def freeze(self) -> "Mutant":
+        """Compute the mutant identity once, i.e. its SHA256 digest
+        and the 64-bit key made out of the first 8 bytes of it.
+        Must be called after every hash attribute is set"""
         s = b"_".join(str(e).encode("utf-8") for e in self.hash_tuple)
-        h = hashlib.sha256(s)
-        digest = int(h.hexdigest(), base=16)
-        return digest
+        self._digest = hashlib.sha256(s).digest()
+        self._key = int.from_bytes(self._digest[:8], "big")
+        return self
+
+    @property
+    def digest(self) -> bytes:
+        """SHA256 digest of the hash tuple"""
+        if self._digest is None:
+            self.freeze()
+        return self._digest
+
+    @property
+    def key(self) -> int:
+        """Compact 64-bit identity of the mutant"""
+        if self._key is None:
+            self.freeze()
+        return self._key
+
+    @property
+    def digest_hash(self) -> int:
+        """hash() of the SHA256 digest as an integer (Python reduces it to
+        61 bits); it's the mutant id in written tables and files, as it was
+        before the 64-bit key, so that they can be joined with older ones"""
+        return hash(int.from_bytes(self.digest, "big"))
+
+    def __hash__(self):
+        return self.key
 
     def __eq__(self, other):
-        return (
-            type(self) is type(other)
-            and len(self.hash_tuple) == len(other.hash_tuple)
-            and all(el1 == el2 for (el1, el2) in zip(self.hash_tuple, other.hash_tuple))
-        )
+        return type(self) is type(other) and self.digest == other.digest
 
     def __repr__(self):
         return f"Mutant{self.hash_tuple}"
@@ -69,7 +118,30 @@ class GitDiff:
         return "".join(self.lines)
 
     @classmethod
-    def gen_diffs(cls, src: str, dst: str):
+    def from_hunk(cls, hunk: Hunk, src_lines: [str], dst_lines: [str]) -> "GitDiff":
+        """Make a diff out of a hunk, with its unified diff text"""
+        source = cls.format_range(hunk.source_line, hunk.source_count)
+        destination = cls.format_range(hunk.destination_line, hunk.destination_count)
+
+        lines = [f"@@ -{source} +{destination} @@\n"]
+        lines += ["-" + line for line in src_lines[hunk.i1 : hunk.i2]]
+        lines += ["+" + line for line in dst_lines[hunk.j1 : hunk.j2]]
+
+        return cls(
+            source_line=hunk.source_line,
+            source_count=hunk.source_count,
+            destination_line=hunk.destination_line,
+            destination_count=hunk.destination_count,
+            lines=lines,
+        )
+
+    @staticmethod
+    def format_range(line: int, count: int) -> str:
+        """Range of a unified diff header, e.g. 3,2 or 3"""
+        return str(line) if count == 1 else f"{line},{count}"
+
+    @classmethod
+    def gen_diffs(cls, src: str, dst: str, algorithm: str = DEFAULT_ALGORITHM):
         """Get a generator of GitDiff elements"""
         src = pathlib.Path(src)
         dst = pathlib.Path(dst)
@@ -77,91 +149,159 @@ class GitDiff:
         src_lines = open(src).readlines()
         dst_lines = open(dst).readlines()
 
-        diffs_gen = difflib.unified_diff(src_lines, dst_lines, n=0)
-        differences = list(diffs_gen)
+        for hunk in get_hunks(src_lines, dst_lines, algorithm=algorithm):
+            yield cls.from_hunk(hunk, src_lines, dst_lines)
 
-        start_indices = [
-            i for i, line in enumerate(differences) if line.startswith("@@")
+
+class LineOffsetMap:
+    """Cumulative line offsets of a sequence of diffs, sorted by source line.
+
+    Applying the diffs one at time shifts by its delta every line that,
+    already shifted by the previous diffs, is at or after its source line;
+    so a line is shifted by the sum of the deltas of every diff whose
+    source line, minus the offset of the previous diffs, is at or before it.
+    Offsets are found with a binary search over these starts,
+    so remapping n lines over h diffs is O((h + n) log h).
+
+    Remapping never changes the mutants, so that a parsed report
+    can be shared by any number of comparisons"""
+
+    # maps already computed in this process, by source files content hashes
+    memo: Dict[Tuple[str, str, str], "LineOffsetMap"] = {}
+
+    def __init__(self, diffs: Iterable[GitDiff] = ()):
+        self.starts: List[int] = []
+        self.offsets: List[int] = []
+
+        offset = 0
+        for diff in diffs:
+            logging.info(f"Difference found: {repr(diff)}")
+
+            # skip empty deltas
+            if diff.delta == 0:
+                logging.info("Empty difference delta, skip it")
+                continue
+
+            self.starts.append(diff.source_line - offset)
+            offset += diff.delta
+            self.offsets.append(offset)
+
+    def __len__(self):
+        return len(self.starts)
+
+    @classmethod
+    def from_files(
+        cls,
+        src_filepath: Union[str, os.PathLike],
+        dst_filepath: Union[str, os.PathLike],
+        cache: Optional[ReportCache] = None,
+        algorithm: str = DEFAULT_ALGORITHM,
+    ) -> "LineOffsetMap":
+        """Get the map of the diffs between two source files.
+
+        Maps are memoized by the content hashes of the two files
+        (and the diff algorithm), in memory and, if a cache is provided,
+        on disk too; so the files are diffed once, whatever the tool or the run"""
+        key = (
+            get_files_fingerprint([src_filepath]),
+            get_files_fingerprint([dst_filepath]),
+            algorithm,
+        )
+        if key in cls.memo:
+            return cls.memo[key]
+
+        state = cache.load(cls.__name__, "_".join(key), None) if cache else None
+        if state is not None:
+            line_map = cls()
+            line_map.starts, line_map.offsets = state["starts"], state["offsets"]
+        else:
+            line_map = cls(GitDiff.gen_diffs(src_filepath, dst_filepath, algorithm))
+            if cache is not None:
+                state = dict(starts=line_map.starts, offsets=line_map.offsets)
+                cache.store(cls.__name__, "_".join(key), None, state)
+
+        cls.memo[key] = line_map
+        return line_map
+
+    def get_offset(self, line: int) -> int:
+        i = bisect.bisect_right(self.starts, line)
+        return self.offsets[i - 1] if i else 0
+
+    def remap_lines(self, lines: Sequence[int]) -> np.ndarray:
+        """A new array with the shifted lines"""
+        lines = np.asarray(lines, dtype=np.int64)
+        offsets = np.array([0] + self.offsets, dtype=np.int64)
+        return lines + offsets[np.searchsorted(self.starts, lines, side="right")]
+
+    def remap(self, mutants: Sequence[Mutant]) -> List[Mutant]:
+        """A new list of the mutants with shifted lines; shifted mutants
+        are copies, while the others are the same objects"""
+        lines = [mutant.line for mutant in mutants]
+        new_lines = self.remap_lines(lines).tolist()
+
+        remapped = [
+            mutant if line == new_line else mutant.with_line(new_line)
+            for mutant, line, new_line in zip(mutants, lines, new_lines)
         ]
 
-        for i, index in enumerate(start_indices):
-            diffline = differences[index]
-            lines = diffline.split()[1:3]
-
-            source_line_list = lines[0].split(",")
-            if len(source_line_list) == 2:
-                source_count = int(source_line_list[1])
-            else:
-                source_count = 1
-            source_line = int(source_line_list[0].replace("-", ""))
-
-            dest_line_list = lines[1].split(",")
-            if len(dest_line_list) == 2:
-                dest_count = int(dest_line_list[1])
-            else:
-                dest_count = 1
-            dest_line = int(dest_line_list[0].replace("+", ""))
-
-            if i != len(start_indices) - 1:
-                limit = start_indices[i + 1]
-            else:
-                limit = len(differences)
-            block_diffs = differences[index:limit]
-            assert len(block_diffs) == source_count + dest_count + 1
-            yield cls(
-                source_line=source_line,
-                source_count=source_count,
-                destination_line=dest_line,
-                destination_count=dest_count,
-                lines=block_diffs,
-            )
+        shifted = sum(line != new_line for line, new_line in zip(lines, new_lines))
+        logging.info(f"Shifted the 'line' attribute of {shifted} mutants")
+        return remapped
 
 
 class MutantsComparerSets:
-    def __init__(self, first_seq: Sequence[Mutant], second_seq: Sequence[Mutant]):
-        self.check_overlapping(first_seq)
-        self.check_overlapping(second_seq)
-
-        # if I'm here, there are no dups
+    def __init__(
+        self,
+        first_seq: Sequence[Mutant],
+        second_seq: Sequence[Mutant],
+        *,
+        first_set: Optional[Set[Mutant]] = None,
+        second_set: Optional[Set[Mutant]] = None,
+    ):
+        """first_set and second_set can be provided if the sets of the sequences
+        were already made (and checked with get_checked_set), e.g. for
+        a base report shared by many comparisons"""
         self.first_seq = first_seq
-        self.first_set = set(first_seq)
+        self.first_set = self.get_checked_set(first_seq, first_set)
 
         self.second_seq = second_seq
-        self.second_set = set(second_seq)
+        self.second_set = self.get_checked_set(second_seq, second_set)
+
+        # mutants of every kind, see get_data
+        self._data: Optional[MutantsBitsets] = None
 
     @staticmethod
-    def correct_lines(mutants: Sequence[Mutant], src_filepath: str, dst_filepath: str):
+    def get_checked_set(
+        mutants: Sequence[Mutant], mutants_set: Optional[Set[Mutant]] = None
+    ) -> Set[Mutant]:
+        """The set of mutants, checked for overlapping mutants;
+        if it's already provided, it's returned as is"""
+        if mutants_set is not None:
+            return mutants_set
+
+        MutantsComparerSets.check_overlapping(mutants)
+        return set(mutants)
+
+    @staticmethod
+    def correct_lines(
+        mutants: Sequence[Mutant],
+        src_filepath: str,
+        dst_filepath: str,
+        cache: Optional[ReportCache] = None,
+        algorithm: str = DEFAULT_ALGORITHM,
+    ):
         """This function should be called if a mutants set should be corrected
-        because of mismatching lines (e.g. a buggy and a fixed version of the same Java file)."""
+        because of mismatching lines (e.g. a buggy and a fixed version of the same Java file).
+        The corrected mutants are returned, while the provided ones are left untouched.
+        algorithm is the diff algorithm of the files (see diff.get_hunks)."""
 
         # sort mutants based on their mutation line
         sorted_mutants = sorted(mutants, key=lambda mutant: mutant.line)
 
-        for diff in GitDiff.gen_diffs(src_filepath, dst_filepath):
-            logging.info(f"Difference found: {repr(diff)}")
-
-            # skip empty deltas
-            if diff.delta == 0:
-                logging.info("Empty difference delta, skip it")
-                continue
-            # else get mutants that will be affected by this change
-            affected_mutants = [
-                mutation
-                for mutation in sorted_mutants
-                if mutation.line >= diff.source_line
-            ]
-            logging.info(
-                f"Changing the 'line' attribute of {len(affected_mutants)} mutants"
-            )
-
-            for mutation in affected_mutants:
-                logging.debug(
-                    f"From line {mutation.line} to line "
-                    f"{mutation.line + diff.delta} - {repr(mutation)}"
-                )
-                mutation.line += diff.delta
-
-        return sorted_mutants
+        offsets = LineOffsetMap.from_files(
+            src_filepath, dst_filepath, cache=cache, algorithm=algorithm
+        )
+        return offsets.remap(sorted_mutants)
 
     @staticmethod
     def find_overlapping_mutants(mutants: Sequence[Mutant]):
@@ -183,57 +323,32 @@ class MutantsComparerSets:
         else:
             logging.debug("No overlapping mutant found")
 
-    def summary(self, dirname: str = None):
-        """Print a summary and write on files the output"""
+    def get_data(self) -> MutantsBitsets:
+        """The mutants of every kind, as a mapping that materializes
+        each kind on first access; its counts need no materialization"""
+        if self._data is None:
+            self._data = MutantsBitsets(self.first_seq, self.second_seq)
+        return self._data
+
+    def summary(self, dirname: str = None, sink: Optional[SummarySink] = None):
+        """Print a summary and write the output on the sink,
+        by default a directory of files under 'result'"""
         now = str(datetime.datetime.now()).replace(":", ".").replace(".", "-")
-        path = pathlib.Path("result")
-        thedir = f"{dirname} {now}" if dirname else now
-        path /= thedir
-        os.makedirs(path)
-
-        # original
-        # first set
-        with open(path / "first_set.txt", "w") as f:
-            f.write("\n\n".join([str(m) for m in self.first_seq]))
-
-        # second set
-        with open(path / "second_set.txt", "w") as f:
-            f.write("\n\n".join([str(m) for m in self.second_seq]))
-
-        # intersection
-        intersection = list(self.first_set & self.second_set)
-        with open(path / "intersection.txt", "w") as f:
-            f.write("\n\n".join([str(m) for m in intersection]))
-
-        # union
-        union = list(self.first_set | self.second_set)
-        with open(path / "union.txt", "w") as f:
-            f.write("\n\n".join([str(m) for m in union]))
-
-        # diff 1-2
-        first_diff = list(self.first_set - self.second_set)
-        with open(path / "first_diff.txt", "w") as f:
-            f.write("\n\n".join([str(m) for m in first_diff]))
-
-        # diff 2-1
-        second_diff = list(self.second_set - self.first_set)
-        with open(path / "second_diff.txt", "w") as f:
-            f.write("\n\n".join([str(m) for m in second_diff]))
-
-        # xor
-        xor = list(self.first_set ^ self.second_set)
-        with open(path / "xor.txt", "w") as f:
-            f.write("\n\n".join([str(m) for m in xor]))
+        sink = sink or DirectorySummarySink()
+
+        data = self.get_data()
+        counts = data.get_counts()
+        sink.write(dirname, now, data, counts)
 
         msg = (
             f"SUMMARY LIVE MUTANTS - lengths:\n"
-            f"First set: {len(self.first_seq)}\n"
-            f"Second set: {len(self.second_seq)}\n"
-            f"Intersection: {len(intersection)}\n"
-            f"Union: {len(union)}\n"
-            f"First - Second: {len(first_diff)}\n"
-            f"Second - First: {len(second_diff)}\n"
-            f"Xor: {len(xor)}\n"
+            f"First set: {counts['first']}\n"
+            f"Second set: {counts['second']}\n"
+            f"Intersection: {counts['intersection']}\n"
+            f"Union: {counts['union']}\n"
+            f"First - Second: {counts['first_diff']}\n"
+            f"Second - First: {counts['second_diff']}\n"
+            f"Xor: {counts['xor']}\n"
             f"(now: {now})"
         )
         logging.info(msg)
@@ -247,16 +362,7 @@ class MutantsComparerSets:
         index: bool = True,
     ) -> pd.Series:
         kind = kind.lower()
-        kinds = (
-            "first",
-            "second",
-            "union",
-            "intersection",
-            "first_diff",
-            "second_diff",
-            "xor",
-        )
-        kinds = sorted(kinds)
+        kinds = sorted(KINDS)
         if kind not in kinds:
             raise ValueError(f"Kind '{kind}' must be one of {kinds}")
 
@@ -266,18 +372,8 @@ class MutantsComparerSets:
         if data_type not in data_types:
             raise ValueError(f"Data type '{data_type}' must be one of {data_types}")
 
-        data_dict = {
-            "first": self.first_seq,
-            "second": self.second_seq,
-            "intersection": list(self.first_set & self.second_set),
-            "union": list(self.first_set | self.second_set),
-            "xor": list(self.first_set ^ self.second_set),
-            "first_diff": list(self.first_set - self.second_set),
-            "second_diff": list(self.second_set - self.first_set),
-        }
-
-        original_data = data_dict[kind]
-        hash_data = [hash(mutant) for mutant in original_data]
+        original_data = self.get_data()[kind]
+        hash_data = [mutant.digest_hash for mutant in original_data]
 
         if data_type == "original":
             data = original_data
@@ -300,6 +396,8 @@ class MutantsComparer:
         fixed_filepath: [str, os.PathLike],
         subject: str = None,
         tool: str = None,
+        cache: Optional[ReportCache] = None,
+        algorithm: str = DEFAULT_ALGORITHM,
     ):
         self.buggy_mutants: [Mutant] = buggy_mutants
         self.fixed_mutants: [Mutant] = fixed_mutants
@@ -310,7 +408,13 @@ class MutantsComparer:
         self.subject = subject
         self.tool = tool
 
-    def get_git_diffs_gen(self):
+        # the cache of line offset maps
+        self.cache = cache
+
+        # the diff algorithm of the source files, see diff.get_hunks
+        self.algorithm = algorithm
+
+    def check_source_files(self):
         # check for user errors
         buggy_filepath = pathlib.Path(self.buggy_filepath)
         fixed_filepath = pathlib.Path(self.fixed_filepath)
@@ -324,52 +428,22 @@ class MutantsComparer:
                 err += f" Subject: {self.subject}"
             raise FileNotFoundError(err)
 
-        buggy_lines = open(buggy_filepath).readlines()
-        fixed_lines = open(fixed_filepath).readlines()
+        return buggy_filepath, fixed_filepath
 
-        differences = list(
-            difflib.unified_diff(
-                buggy_lines,
-                fixed_lines,
-                n=0,
-            )
+    def get_line_offsets(self) -> LineOffsetMap:
+        """The (memoized) line offset map from buggy to fixed source file"""
+        buggy_filepath, fixed_filepath = self.check_source_files()
+        return LineOffsetMap.from_files(
+            buggy_filepath, fixed_filepath, cache=self.cache, algorithm=self.algorithm
         )
 
-        start_indices = [
-            i for i, line in enumerate(differences) if line.startswith("@@")
-        ]
-
-        for i, index in enumerate(start_indices):
-            diffline = differences[index]
-            lines = diffline.split()[1:3]
-
-            source_line_list = lines[0].split(",")
-            if len(source_line_list) == 2:
-                source_count = int(source_line_list[1])
-            else:
-                source_count = 1
-            source_line = int(source_line_list[0].replace("-", ""))
-
-            dest_line_list = lines[1].split(",")
-            if len(dest_line_list) == 2:
-                dest_count = int(dest_line_list[1])
-            else:
-                dest_count = 1
-            dest_line = int(dest_line_list[0].replace("+", ""))
-
-            if i != len(start_indices) - 1:
-                limit = start_indices[i + 1]
-            else:
-                limit = len(differences)
-            block_diffs = differences[index:limit]
-            assert len(block_diffs) == source_count + dest_count + 1
-            yield GitDiff(
-                source_line=source_line,
-                source_count=source_count,
-                destination_line=dest_line,
-                destination_count=dest_count,
-                lines=block_diffs,
-            )
+    def get_git_diffs_gen(self, algorithm: Optional[str] = None):
+        """Get a generator of the diffs from buggy to fixed source file,
+        with the comparer's diff algorithm if algorithm is None"""
+        buggy_filepath, fixed_filepath = self.check_source_files()
+        return GitDiff.gen_diffs(
+            buggy_filepath, fixed_filepath, algorithm=algorithm or self.algorithm
+        )
 
     @staticmethod
     def find_duplicate_mutants(mutants_list):
@@ -392,10 +466,7 @@ class MutantsComparer:
         with open(fp, "w") as f:
             # m is mutant, h is its hash
             s = self.pprint_list(
-                [
-                    (h, m)
-                    for (h, m) in [(hash(mutant), mutant) for mutant in mutant_list]
-                ]
+                [(mutant.digest_hash, mutant) for mutant in mutant_list]
             )
             f.write(s)
 
@@ -404,34 +475,9 @@ class MutantsComparer:
         return "\n".join(str(elem) for elem in alist)
 
     def get_difference_set(self):
-        # make a tmp copy of fixed mutants
-        fixed_mutants = sorted(
-            self.fixed_mutants.copy(), key=lambda mutant: mutant.line
-        )
-
-        for diff in self.get_git_diffs_gen():
-            logging.info(f"Difference found: {repr(diff)}")
-
-            # skip empty deltas
-            if diff.delta == 0:
-                logging.info("Empty difference delta, skip it")
-                continue
-            # else get mutants that will be affected by this change
-            affected_mutants = [
-                mutation
-                for mutation in fixed_mutants
-                if mutation.line >= diff.source_line
-            ]
-            logging.info(
-                f"Changing the 'line' attribute of {len(affected_mutants)} mutants"
-            )
-
-            for mutation in affected_mutants:
-                logging.debug(
-                    f"From line {mutation.line} to line "
-                    f"{mutation.line + diff.delta} - {repr(mutation)}"
-                )
-                mutation.line += diff.delta
+        # fixed mutants with corrected lines; the report ones are left untouched
+        fixed_mutants = sorted(self.fixed_mutants, key=lambda mutant: mutant.line)
+        fixed_mutants = self.get_line_offsets().remap(fixed_mutants)
 
         logging.debug(f"Buggy mutants: {self.buggy_mutants}")
         logging.debug(f"Fixed mutants: {fixed_mutants}")
@@ -0,0 +1,113 @@
+import gzip
+import os
+import pathlib
+from abc import ABC
+from typing import Dict, Mapping, Sequence, Union
+
+# the kinds of mutants sequences of a comparison, in order
+KINDS = (
+    "first",
+    "second",
+    "intersection",
+    "union",
+    "first_diff",
+    "second_diff",
+    "xor",
+)
+
+ERR_SHORT_WRITE = "Cannot append to {path}: {left} bytes were not written"
+
+
+def append_to_file(path: Union[str, os.PathLike], data: bytes):
+    """Append data to a file with a single write, so that processes
+    appending to the same file never interleave. A short write (e.g. an
+    interrupted one) is completed by writing the rest, so that records are
+    never truncated; an error is raised if nothing more can be written"""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            if written == 0:
+                raise OSError(ERR_SHORT_WRITE.format(path=path, left=len(view)))
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+class SummarySink(ABC):
+    """Where the summary of a comparison is written; sinks
+    are pickled to be used by worker processes too"""
+
+    def write(
+        self,
+        name: str,
+        now: str,
+        data: Mapping[str, Sequence],
+        counts: Dict[str, int],
+    ):
+        """Write the mutants of every kind of a comparison, with their counts;
+        name identifies the comparison, while now is its timestamp.
+        data can materialize the mutants of a kind only when accessed"""
+        raise NotImplementedError
+
+
+class NullSummarySink(SummarySink):
+    """Write nothing"""
+
+    def write(self, name, now, data, counts):
+        pass
+
+
+class DirectorySummarySink(SummarySink):
+    """Write a directory for every comparison, with
+    a text file for every kind of mutants"""
+
+    filenames = {"first": "first_set.txt", "second": "second_set.txt"}
+
+    def __init__(self, root: Union[str, os.PathLike] = "result"):
+        self.root = pathlib.Path(root)
+
+    def write(self, name, now, data, counts):
+        thedir = f"{name} {now}" if name else now
+        path = self.root / thedir
+        os.makedirs(path)
+
+        for kind in KINDS:
+            filename = self.filenames.get(kind, f"{kind}.txt")
+            with open(path / filename, "w") as f:
+                f.write("\n\n".join([str(m) for m in data[kind]]))
+
+
+class CountsSummarySink(SummarySink):
+    """Append the count of every kind of mutants of
+    every comparison to a CSV file, created with the sink"""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = pathlib.Path(path)
+        header = ",".join(("name", "now") + KINDS) + "\n"
+        self.path.write_text(header)
+
+    def write(self, name, now, data, counts):
+        values = [str(counts[kind]) for kind in KINDS]
+        row = ",".join([f'"{name or ""}"', now] + values) + "\n"
+        append_to_file(self.path, row.encode("utf-8"))
+
+
+class ConsolidatedSummarySink(SummarySink):
+    """Append every comparison to a single gzip file, created with the sink;
+    every comparison is a gzip member of its own, so the file can be
+    read whole with gzip.open"""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = pathlib.Path(path)
+        self.path.write_bytes(b"")
+
+    def write(self, name, now, data, counts):
+        buffer = [f"=== {name or ''} ({now}) ==="]
+        for kind in KINDS:
+            buffer.append(f"--- {kind}: {counts[kind]} ---")
+            buffer.extend(str(m) for m in data[kind])
+
+        text = "\n".join(buffer) + "\n"
+        append_to_file(self.path, gzip.compress(text.encode("utf-8")))
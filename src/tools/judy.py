@@ -1,44 +1,38 @@
-import json
 import os
 from collections import defaultdict
+from typing import Dict
+
+from reports.parsers import JudyResult
 
 from src import model
 
 
 class MutantOperator:
-    operators = {}
-
-    @classmethod
-    def reset_operators(cls):
-        cls.operators = {}
-
     def __init__(self, adict):
         self.name: str = adict["name"]
         self.description: str = adict["description"]
 
-        if self.name in self.operators:
-            msg = (
-                f"Found duplicate operator name! "
-                f"{self.name} found, but got already {self.operators[self.name]}"
-            )
-            raise ValueError(msg)
-        else:
-            self.operators[self.name] = self
-
-    @classmethod
-    def find_by_name(cls, name: str):
-        return cls.operators[name]
+    @staticmethod
+    def get_operators_by_name(operators: list) -> Dict[str, "MutantOperator"]:
+        """Index the operators of a report by their name"""
+        operators_by_name = {}
+        for operator in operators:
+            if operator.name in operators_by_name:
+                msg = (
+                    f"Found duplicate operator name! {operator.name} found,"
+                    f" but got already {operators_by_name[operator.name]}"
+                )
+                raise ValueError(msg)
+            else:
+                operators_by_name[operator.name] = operator
+        return operators_by_name
 
     def __repr__(self):
         return f"MutantOperator(name={self.name}, description={self.description})"
 
 
 class Mutant(model.Mutant):
-    counter = defaultdict(int)
-
-    @classmethod
-    def reset_counter(cls):
-        cls.counter = defaultdict(int)
+    __slots__ = ("points", "operator", "_count")
 
     @property
     def hash_tuple(self) -> tuple:
@@ -48,7 +42,14 @@ class Mutant(model.Mutant):
     def _hash_tuple(self) -> tuple:
         return self.line, self.operator.name
 
-    def __init__(self, adict):
+    def __init__(
+        self,
+        adict,
+        operators_by_name: Dict[str, MutantOperator],
+        counter: Dict[tuple, int],
+    ):
+        """operators_by_name are the report operators, while counter
+        is the report counter of mutants sharing line and operator"""
         lines = adict["lines"]
         operators = adict["operators"]
         points = adict["points"]
@@ -59,13 +60,15 @@ class Mutant(model.Mutant):
 
         super().__init__(line=int(line))
         self.points: int = points
-        self.operator = MutantOperator.find_by_name(operator)
+        self.operator = operators_by_name[operator]
 
         # fix different mutations but with same line
         # and description with a counter
-        thehash = hash(self._hash_tuple)
-        self._count = Mutant.counter[thehash]
-        Mutant.counter[thehash] += 1
+        key = self._hash_tuple
+        self._count = counter[key]
+        counter[key] += 1
+
+        self.freeze()
 
     def __str__(self):
         if self.original_line != self.line:
@@ -91,19 +94,15 @@ class Report(model.Report):
         self.live_mutants = None
 
     def makeit(self):
-        # reset counter when we create the report
-        Mutant.reset_counter()
+        # counter is created with the report
+        counter = defaultdict(int)
 
-        with open(self.result_fp) as f:
-            result = json.load(f)
+        result = JudyResult.load(self.result_fp)
         # instantiate operators to use them in Mutants
-        self.operators = [MutantOperator(adict) for adict in result["operators"]]
+        self.operators = [MutantOperator(adict) for adict in result.operators]
+        operators = MutantOperator.get_operators_by_name(self.operators)
 
-        classdict = [
-            thedict
-            for thedict in result["classes"]
-            if self.classname == thedict["name"]
-        ]
+        classdict = result.get_class_entries(self.classname)
 
         if not classdict:
             raise ValueError(
@@ -118,10 +117,9 @@ class Report(model.Report):
         self.total_mutants_count = classdict["mutantsCount"]
         self.killed_mutants_count = classdict["mutantsKilledCount"]
         self.live_mutants_count = self.total_mutants_count - self.killed_mutants_count
-        self.live_mutants = [Mutant(mdict) for mdict in classdict["notKilledMutant"]]
-
-        # at the end of execution, reset mutant operator dictionary
-        MutantOperator.reset_operators()
+        self.live_mutants = [
+            Mutant(mdict, operators, counter) for mdict in classdict["notKilledMutant"]
+        ]
 
     def get_live_mutants(self):
         return self.live_mutants
@@ -1,33 +1,35 @@
-import re
 from collections import defaultdict
+from typing import Dict
+
+from reports.parsers import scan_jumble_output
+from reports.utility import intern_string
 
 from src import model
 
 
 class Mutant(model.Mutant):
-    counter = defaultdict(int)
-
-    @classmethod
-    def reset_counter(cls):
-        cls.counter = defaultdict(int)
+    __slots__ = ("mutation", "count")
 
     @property
     def hash_tuple(self) -> tuple:
         return self.line, self.mutation, self.count
 
-    def __init__(self, match):
+    def __init__(self, match, counter: Dict[tuple, int]):
         # tuple-like obj in the format
-        # classname, line, mutation
+        # classname, line, mutation;
+        # counter is the report counter of mutants sharing line and mutation
         line = int(match[1])
         super().__init__(line=line)
 
-        self.mutation: str = match[2].strip()
+        self.mutation: str = intern_string(match[2].strip())
 
         # fix different mutations but with same line
         # and description with a counter
         key = (self.line, self.mutation)
-        self.count = Mutant.counter[key]
-        Mutant.counter[key] += 1
+        self.count = counter[key]
+        counter[key] += 1
+
+        self.freeze()
 
     def __str__(self):
         if self.line != self.original_line:
@@ -57,43 +59,25 @@ class Report(model.Report):
         return self.killed_mutants_count + self.live_mutants_count
 
     def makeit(self):
-        # first reset counter
-        Mutant.reset_counter()
-
-        # then scrape the output
-        fail_pattern = re.compile(r"M FAIL:\s*([a-zA-Z.]+):(\d+):\s*(.+)")
-        start_pattern = re.compile(
-            r"Mutation points = \d+, unit test time limit \d+\.\d+s"
-        )
-        end_pattern = re.compile(r"Jumbling took \d+\.\d+s")
+        # counter is created with the report
+        counter = defaultdict(int)
 
-        # but also check out for errors
-        score_pattern = re.compile(r"Score: \d+%(\s*\(([\w\s]+)\))?")
-
-        with open(self.filepath) as f:
-            text = f.read()
+        # then scan the output
+        output = scan_jumble_output(self.filepath)
 
         # check if there are errors
-        msg = score_pattern.search(text).group(2)
-        if msg:
+        if output.error:
             errmsg = (
                 f"Invalid Jumble output provided! {self.filepath}"
-                f"\nJumble error: {msg}"
+                f"\nJumble error: {output.error}"
             )
             raise ValueError(errmsg)
 
-        # get indices where the mutants are defined
-        i = start_pattern.search(text).end()
-        j = end_pattern.search(text[i:]).start() + i
-
-        # subtract from text all the fails + get count of them
-        killed_text, live_mutants_count = fail_pattern.subn("", text[i:j])
-
-        # get killed count as length of mutations with whitespaces removed
-        self.killed_mutants_count = len(re.sub(r"\s+", "", killed_text))
+        # killed count is the number of mutation dots
+        self.killed_mutants_count = output.killed_count
 
-        # create live mutants as constructor over a match for all matches found
-        self.live_mutants = [Mutant(match) for match in fail_pattern.findall(text[i:j])]
+        # create live mutants as constructor over a FAIL record for all records found
+        self.live_mutants = [Mutant(fail, counter) for fail in output.fails]
         self.live_mutants_count = len(self.live_mutants)
 
     def __repr__(self):
@@ -1,8 +1,10 @@
 import io
 import os
 from collections import defaultdict
+from typing import Dict
 
 import pandas as pd
+from reports.utility import intern_string
 
 from src import model
 
@@ -52,23 +54,35 @@ class OldMutant(model.Mutant):
 
 
 class Mutant(model.Mutant):
-    counter_hashkey = defaultdict(int)
-
-    def __init__(self, mutation_series: pd.Series):
-        self.status = mutation_series.Status
-        self.operator = mutation_series.Operator
-        self.from_ = mutation_series.From
-        self.to = mutation_series.To
-        self.signature = mutation_series.Signature
+    __slots__ = (
+        "mutant_no",
+        "status",
+        "operator",
+        "from_",
+        "to",
+        "signature",
+        "description",
+        "_counter",
+    )
+
+    def __init__(self, mutation_series: pd.Series, counter: Dict[tuple, int]):
+        """counter is the report counter of mutants sharing every
+        hash attribute, but the count itself"""
+        self.mutant_no = mutation_series.name
+        self.status = intern_string(mutation_series.Status)
+        self.operator = intern_string(mutation_series.Operator)
+        self.from_ = intern_string(mutation_series.From)
+        self.to = intern_string(mutation_series.To)
+        self.signature = intern_string(mutation_series.Signature)
         self.line = mutation_series.LineNumber
         self.original_line = self.line
-        self.description = mutation_series.Description
+        self.description = intern_string(mutation_series.Description)
 
-        self._series = mutation_series
+        key = self._hash_tuple
+        self._counter = counter[key]
+        counter[key] += 1
 
-        thehash = hash((mutation_series[k] for k in self._hash_tuple))
-        self._counter = self.counter_hashkey[thehash]
-        self.counter_hashkey[thehash] += 1
+        self.freeze()
 
     @property
     def _hash_tuple(self) -> tuple:
@@ -90,7 +104,32 @@ class Mutant(model.Mutant):
             org = f" (original: {self.original_line})"
         else:
             org = ""
-        return f"Mutant at line {self.line}{org}\n" f"{str(self._series)}"
+        return f"Mutant at line {self.line}{org}\n" f"{str(self.to_series())}"
+
+    def to_series(self) -> pd.Series:
+        """The mutants.log and kill.csv row of this mutant"""
+        return pd.Series(
+            [
+                self.operator,
+                self.from_,
+                self.to,
+                self.signature,
+                self.original_line,
+                self.description,
+                self.status,
+            ],
+            index=[
+                "Operator",
+                "From",
+                "To",
+                "Signature",
+                "LineNumber",
+                "Description",
+                "Status",
+            ],
+            name=self.mutant_no,
+            dtype=object,
+        )
 
 
 class Report(model.Report):
@@ -149,8 +188,9 @@ class Report(model.Report):
         killed_count = len(killed_mutants)
         assert len(df) == live_count + killed_count
 
+        counter = defaultdict(int)
         for index, row in df.iterrows():
-            mutant = Mutant(row)
+            mutant = Mutant(row, counter)
             if mutant.status == "LIVE":
                 self.live_mutants.append(mutant)
             else:
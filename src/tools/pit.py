@@ -1,24 +1,38 @@
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from typing import Dict
+
+from reports.utility import intern_string
 
 from src import model
 
 
 class Mutant(model.Mutant):
-    counter = defaultdict(int)
-
-    @classmethod
-    def reset_counter(cls):
-        cls.counter = defaultdict(int)
-
-    def __init__(self, element: ET.Element):
+    __slots__ = (
+        "detected",
+        "status",
+        "source_file",
+        "mutated_class",
+        "mutated_method",
+        "method_description",
+        "mutator",
+        "index",
+        "block",
+        "killing_test",
+        "description",
+        "count",
+    )
+
+    def __init__(self, element: ET.Element, counter: Dict[tuple, int]):
+        """counter is the report counter of mutants sharing every
+        hash attribute, but the count itself"""
         DETECTED_STATUS = {"true": True, "false": False}
 
         attribs = element.attrib
         """detected is wether the mutant is detected
         (killed, timed out, memory error) or not (survived, not covered)."""
         self.detected = DETECTED_STATUS[attribs["detected"]]
-        self.status = attribs["status"]
+        self.status = intern_string(attribs["status"])
 
         children = list(element)
         assert len(children) == 10
@@ -35,7 +49,7 @@ class Mutant(model.Mutant):
             self.block,  # ?
             self.killing_test,  # the test that killed this mutant, if any
             self.description,  # the description of what was done
-        ) = [child.text for child in children]
+        ) = [intern_string(child.text) for child in children]
         super().__init__(int(line))
 
         # fix different mutations but with same line
@@ -49,8 +63,10 @@ class Mutant(model.Mutant):
             self.mutator,
             self.description,
         )
-        self.count = Mutant.counter[key]
-        Mutant.counter[key] += 1
+        self.count = counter[key]
+        counter[key] += 1
+
+        self.freeze()
 
     @property
     def hash_tuple(self) -> tuple:
@@ -86,8 +102,8 @@ class Report(model.Report):
         self.live_mutants = None
 
     def makeit(self):
-        # reset class counter
-        Mutant.reset_counter()
+        # counter is created with the report
+        counter = defaultdict(int)
 
         tree = ET.parse(self.filepath)
         root = tree.getroot()
@@ -95,7 +111,7 @@ class Report(model.Report):
         mutants = []
 
         for child in children:
-            mutants.append(Mutant(child))
+            mutants.append(Mutant(child, counter))
 
         self.mutants = mutants
         self.killed_mutants = [mutation for mutation in mutants if mutation.detected]
@@ -1,8 +1,12 @@
 import logging
 import os
 import pathlib
+from typing import Optional
+
+from reports.cache import ReportCache
 
 from src import model
+from src.diff import DEFAULT_ALGORITHM
 from src.tools import JudyReport, JumbleReport, MajorReport, PitReport
 
 tools = ["judy", "jumble", "major", "pit"]
@@ -34,6 +38,8 @@ class ReportFactory:
         make_buggy_report=True,
         make_fixed_report=True,
         base_dir="data",
+        cache: Optional[ReportCache] = None,
+        algorithm: str = DEFAULT_ALGORITHM,
     ):
         assert tool in tools
         self.tool = tool
@@ -42,6 +48,8 @@ class ReportFactory:
         self.subject = subject
 
         self.root_dir = get_root_dir(tool, subject, base_dir=base_dir)
+        self.cache = cache
+        self.algorithm = algorithm
 
         logging.debug(f"Root dir is {self.root_dir}")
 
@@ -93,6 +101,8 @@ class ReportFactory:
             fixed_filepath=self.fixed_filepath(),
             subject=self.subject,
             tool=self.tool,
+            cache=self.cache,
+            algorithm=self.algorithm,
         )
 
         return comparer.get_difference_set()
@@ -1,10 +1,25 @@
 import logging
+import pathlib
 
 import pandas as pd
 
+from src.incidence import get_incidence_paths, read_incidence
 from src.utility import subjects, tools
 
 
+def get_live_counts(root_dir: str, subject: str, tool: str) -> pd.Series:
+    """Live mutants count of every group, from the compact
+    incidence table if available, otherwise from the mutants' table"""
+    prefix = pathlib.Path(f"{root_dir}/{subject}/{tool}/{subject}_{tool}")
+    incidence_path, _ = get_incidence_paths(prefix)
+
+    if incidence_path.exists():
+        return read_incidence(prefix).sum(axis=1)
+    else:
+        df = pd.read_csv(f"{prefix}.csv", index_col=0)
+        return df.count(axis=1)
+
+
 def main(root_dir: str = "data_cmp"):
     # valid_tools = [tool for tool in tools if tool != "judy"]
     valid_tools = tools
@@ -13,10 +28,9 @@ def main(root_dir: str = "data_cmp"):
 
     for subject in subjects:
         for tool in valid_tools:
-            csvpath = f"{root_dir}/{subject}/{tool}/{subject}_{tool}.csv"
-            df = pd.read_csv(csvpath, index_col=0)
+            counts = get_live_counts(root_dir, subject, tool)
 
-            ddf = pd.DataFrame(df.count(axis=1), columns=["live_count"])
+            ddf = pd.DataFrame(counts, columns=["live_count"])
             ddf["Group"] = ddf.index.str.extract(r"(\w\d).*").set_index(ddf.index)
             ddf["Tool"] = tool.capitalize()
             ddf["Project"] = subject.capitalize()
@@ -0,0 +1,74 @@
+import difflib
+import random
+
+import pytest
+
+from src.diff import get_hunks
+from src.model import GitDiff
+
+PAIRS = 1000
+MAX_LINES = 40
+
+# few distinct lines, so that sides are repetitive as sources are
+LINES = [f"line {i}\n" for i in range(6)]
+
+
+def get_pairs(seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(PAIRS):
+        a = rng.choices(LINES, k=rng.randint(0, MAX_LINES))
+        b = list(a)
+        for _ in range(rng.randint(0, 8)):
+            position = rng.randint(0, len(b))
+            if b and rng.random() < 0.5:
+                del b[min(position, len(b) - 1)]
+            else:
+                b.insert(position, rng.choice(LINES))
+        yield a, b
+
+
+def get_lcs_length(a, b) -> int:
+    lengths = [0] * (len(b) + 1)
+    for x in a:
+        previous = 0
+        for j, y in enumerate(b, start=1):
+            current = lengths[j]
+            if x == y:
+                lengths[j] = previous + 1
+            else:
+                lengths[j] = max(lengths[j], lengths[j - 1])
+            previous = current
+    return lengths[-1]
+
+
+def get_matched_count(a, b, hunks) -> int:
+    """Number of unchanged lines of the hunks, that must be
+    the same lines in both sides for the hunks to be an edit script"""
+    count = i = j = 0
+    for hunk in list(hunks) + [(len(a), len(a), len(b), len(b))]:
+        i1, i2, j1, j2 = hunk
+        assert i1 - i == j1 - j
+        assert a[i:i1] == b[j:j1]
+        count += i1 - i
+        i, j = i2, j2
+    return count
+
+
+def test_difflib_hunks_match_unified_diff():
+    for a, b in get_pairs():
+        expected = [
+            line for line in difflib.unified_diff(a, b, n=0) if line.startswith("@@")
+        ]
+        hunks = get_hunks(a, b, algorithm="difflib")
+        headers = [GitDiff.from_hunk(hunk, a, b).lines[0] for hunk in hunks]
+        assert headers == expected
+
+
+@pytest.mark.parametrize("algorithm", ["myers", "patience"])
+def test_hunks_are_edit_scripts(algorithm):
+    for a, b in get_pairs(seed=1):
+        count = get_matched_count(a, b, get_hunks(a, b, algorithm=algorithm))
+
+        # Myers' script is a shortest one, so it matches a longest common subsequence
+        if algorithm == "myers":
+            assert count == get_lcs_length(a, b)
@@ -0,0 +1,36 @@
+from reports.commands import SimilarityCommand
+from reports.reports import MajorReport
+
+SIGNATURE = "org.example.Foo@bar(int)"
+
+MUTANTS_LOG = "\n".join(
+    [
+        f"1:AOR:+(int,int):-(int,int):{SIGNATURE}:10:a + b |==> a - b",
+        f"2:ROR:<(int,int):<=(int,int):{SIGNATURE}:12:a < b |==> a <= b",
+        f"3:LVR:0:1:{SIGNATURE}:15:0 |==> 1",
+    ]
+)
+
+# both suites kill the same mutants, but in different ways
+STATUSES = {
+    "a": ("FAIL", "FAIL", "LIVE"),
+    "b": ("EXC", "TIME", "LIVE"),
+}
+
+
+def test_similarity_of_killed_mutants_ignores_status(tmp_path):
+    reports = []
+    for suite, statuses in STATUSES.items():
+        root = tmp_path / suite
+        root.mkdir()
+        (root / "mutants.log").write_text(MUTANTS_LOG + "\n")
+        rows = [f"{i},{status}" for i, status in enumerate(statuses, start=1)]
+        kill_csv = "MutantNo,[FAIL | TIME | EXC | LIVE]\n" + "\n".join(rows) + "\n"
+        (root / "kill.csv").write_text(kill_csv)
+        reports.append(MajorReport(root / "mutants.log", root / "kill.csv"))
+
+    command = SimilarityCommand(reports)
+    df = command.get_clusters_table(use_killed_mutants=True, threshold=0.9)
+
+    assert df["cluster"].nunique() == 1
+    assert df["jaccard"].tolist() == [1.0, 1.0]
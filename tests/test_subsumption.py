@@ -0,0 +1,76 @@
+import io
+from contextlib import redirect_stdout
+
+import numpy as np
+from reports.commands import SubsumptionCommand
+from reports.reports import MajorReport
+
+SIGNATURE = "org.example.Foo@bar(int)"
+
+# mutants 1 and 4 share every field, so only their number tells them apart
+MUTANTS_LOG = "\n".join(
+    [
+        f"1:AOR:+(int,int):-(int,int):{SIGNATURE}:10:a + b |==> a - b",
+        f"2:ROR:<(int,int):<=(int,int):{SIGNATURE}:12:a < b |==> a <= b",
+        f"3:LVR:0:1:{SIGNATURE}:15:0 |==> 1",
+        f"4:AOR:+(int,int):-(int,int):{SIGNATURE}:10:a + b |==> a - b",
+    ]
+)
+
+# the statuses of mutants 1, 2, 3 and 4 in every testsuite
+STATUSES = {
+    "a": ("FAIL", "LIVE", "LIVE", "FAIL"),
+    "b": ("EXC", "FAIL", "EXC", "LIVE"),
+    "c": ("TIME", "LIVE", "FAIL", "LIVE"),
+}
+
+
+def make_reports(tmp_path):
+    reports = []
+    for suite, statuses in STATUSES.items():
+        root = tmp_path / suite
+        root.mkdir()
+        (root / "mutants.log").write_text(MUTANTS_LOG + "\n")
+        rows = [f"{i},{status}" for i, status in enumerate(statuses, start=1)]
+        kill_csv = "MutantNo,[FAIL | TIME | EXC | LIVE]\n" + "\n".join(rows) + "\n"
+        (root / "kill.csv").write_text(kill_csv)
+        reports.append(MajorReport(root / "mutants.log", root / "kill.csv"))
+    return reports
+
+
+def test_subsumption_with_mixed_kill_statuses(tmp_path):
+    reports = make_reports(tmp_path)
+
+    with redirect_stdout(io.StringIO()):
+        df = SubsumptionCommand(reports).execute(full=True)
+
+    # mutant 1 is killed by every suite, although in different ways,
+    # so it's a single mutant and not one for every status
+    assert len(df) == 4
+    assert sorted(df["kill_count"].tolist()) == [1, 1, 2, 3]
+
+    # kill vectors: 1 -> {a, b, c}, 2 -> {b}, 3 -> {b, c}, 4 -> {a};
+    # 2 and 4 dominate, while 1 and 3 are redundant
+    lines = df["mutant"].str.extract(r"'line': (\d+)")[0].astype(int)
+    dominators = dict(zip(zip(lines, df["kill_count"]), df["dominator"]))
+    assert dominators == {
+        (10, 3): False,
+        (12, 1): True,
+        (15, 2): False,
+        (10, 1): True,
+    }
+    assert df["dominator"].sum() == 2
+    assert df["class"].nunique() == 4
+
+
+def test_identity_keys_ignore_status(tmp_path):
+    reports = make_reports(tmp_path)
+
+    # mutant 1 is killed with FAIL, EXC and TIME, but has the same identity
+    first_keys = [report.killed_frame.identity_keys[0] for report in reports]
+    assert len(set(first_keys)) == 1
+    assert len({report.killed_frame.keys[0] for report in reports}) == 3
+
+    # mutants 1 and 4 share their fields, but are different mutants
+    killed = reports[0].killed_frame
+    assert len(np.unique(killed.identity_keys)) == 2